@@ -1,5 +1,5 @@
 """backend/__init__.py"""
 
-from .client import QuantReplayClient, Portfolio
+from .client import TERMINAL_EXEC_TYPES, Portfolio, QuantReplayClient
 
-__all__ = ["QuantReplayClient", "Portfolio"]
+__all__ = ["QuantReplayClient", "Portfolio", "TERMINAL_EXEC_TYPES"]
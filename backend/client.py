@@ -12,13 +12,17 @@ FIX session config (must match cfg/configSim.txt):
 
 import logging
 import os
+import selectors
 import socket
+import threading
 import time
-import uuid
+from collections import deque
+from collections.abc import Callable
+from functools import lru_cache
 from urllib.parse import quote
 
 import httpx
-import simplefix
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -26,29 +30,30 @@ logger = logging.getLogger(__name__)
 REST_URL  = os.getenv("QUANTREPLAY_REST_URL", "http://localhost:9050")
 FIX_HOST  = os.getenv("QUANTREPLAY_FIX_HOST", "localhost")
 FIX_PORT  = int(os.getenv("QUANTREPLAY_FIX_PORT", "9051"))
+FIX_SOCK_BUF = int(os.getenv("QUANTREPLAY_FIX_SOCK_BUF", str(1 << 20)))   # SO_SNDBUF/SO_RCVBUF bytes; 0 = kernel default
 
 # Must match cfg/configSim.txt SESSION entries
 FIX_SENDER = "CLIENT_XETRA"
 FIX_TARGET = "SIM_XETRA"
 
 _ORDER_TYPE_TO_FIX = {
-    "LIMIT": "2",
-    "MARKET": "1",
+    "LIMIT": b"2",
+    "MARKET": b"1",
 }
 
 _TIME_IN_FORCE_TO_FIX = {
-    "DAY": "0",
-    "GTC": "1",
-    "IOC": "3",
-    "FOK": "4",
-    "GTD": "6",
+    "DAY": b"0",
+    "GTC": b"1",
+    "IOC": b"3",
+    "FOK": b"4",
+    "GTD": b"6",
 }
 
 _SIDE_TO_FIX = {
-    "BUY": "1",
-    "SELL": "2",
-    "SELL_SHORT": "5",
-    "SELL_SHORT_EXEMPT": "6",
+    "BUY": b"1",
+    "SELL": b"2",
+    "SELL_SHORT": b"5",
+    "SELL_SHORT_EXEMPT": b"6",
 }
 
 _FIX_SIDE_TO_TEXT = {
@@ -86,12 +91,12 @@ _FIX_MD_ENTRY_TYPE_TO_TEXT = {
 }
 
 _MD_ENTRY_TYPE_TO_FIX = {
-    "BID": "0",
-    "OFFER": "1",
-    "TRADE": "2",
-    "LOW": "7",
-    "HIGH": "8",
-    "MID": "H",
+    "BID": b"0",
+    "OFFER": b"1",
+    "TRADE": b"2",
+    "LOW": b"7",
+    "HIGH": b"8",
+    "MID": b"H",
 }
 
 _FIX_MD_UPDATE_ACTION_TO_TEXT = {
@@ -120,29 +125,189 @@ _FIX_TRADING_PHASE_TO_TEXT = {
 }
 
 _MD_SUBSCRIPTION_REQUEST_TO_FIX = {
-    "SNAPSHOT": "0",
-    "SUBSCRIBE": "1",
-    "UNSUBSCRIBE": "2",
+    "SNAPSHOT": b"0",
+    "SUBSCRIBE": b"1",
+    "UNSUBSCRIBE": b"2",
 }
 
 _MD_UPDATE_TYPE_TO_FIX = {
-    "SNAPSHOT": "0",
-    "FULL": "0",
-    "INCREMENTAL": "1",
+    "SNAPSHOT": b"0",
+    "FULL": b"0",
+    "INCREMENTAL": b"1",
 }
 
 _MD_DEPTH_TO_FIX = {
-    "FULL": "0",
-    "TOP": "1",
+    "FULL": b"0",
+    "TOP": b"1",
 }
 
 _SECURITY_SUBSCRIPTION_REQUEST_TO_FIX = {
-    "SNAPSHOT": "0",
-    "SUBSCRIBE": "1",
-    "UNSUBSCRIBE": "2",
+    "SNAPSHOT": b"0",
+    "SUBSCRIBE": b"1",
+    "UNSUBSCRIBE": b"2",
 }
 
-_TERMINAL_EXEC_TYPES = {"CANCELED", "REJECTED", "EXPIRED"}
+# ExecTypes that end an order's life without a fill; shared with tools/orders.py
+TERMINAL_EXEC_TYPES = frozenset(("CANCELED", "REJECTED", "EXPIRED"))
+
+# Market data entry raw tag -> (key, text key, code->text lookup, parse as float).
+# Coded fields store the raw code under key and its translation under text key.
+# Lookups are the maps' bound .get so the parse loop skips the attribute load.
+_MD_ENTRY_FIELDS: dict[bytes, tuple[str, str | None, Callable[[str, str], str] | None, bool]] = {
+    b"269":  ("entry_type_code", "entry_type", _FIX_MD_ENTRY_TYPE_TO_TEXT.get, False),
+    b"278":  ("entry_id", None, None, False),
+    b"270":  ("price", None, None, True),
+    b"271":  ("size", None, None, True),
+    b"272":  ("trade_date", None, None, False),
+    b"273":  ("trade_time", None, None, False),
+    b"288":  ("buyer_id", None, None, False),
+    b"289":  ("seller_id", None, None, False),
+    b"2446": ("aggressor_side_code", "aggressor_side", _FIX_SIDE_TO_TEXT.get, False),
+    b"326":  ("trading_status_code", "trading_status", _FIX_SECURITY_STATUS_TO_TEXT.get, False),
+    b"625":  ("trading_phase_code", "trading_phase", _FIX_TRADING_PHASE_TO_TEXT.get, False),
+    b"336":  ("trading_session_id", None, None, False),
+    b"277":  ("trade_condition", None, None, False),
+}
+_md_entry_type_text = _FIX_MD_ENTRY_TYPE_TO_TEXT.get
+_md_update_action_text = _FIX_MD_UPDATE_ACTION_TO_TEXT.get
+
+
+# ── FIX outbound encoding ────────────────────────────────────────────────────
+
+# Static header fields, encoded once. 8 and 9 lead the message, then 35, then
+# the comp IDs — the same field order simplefix.FixMessage.encode() produced.
+_BEGIN_STRING_FIELD = b"8=FIXT.1.1\x01"
+_COMP_ID_FIELDS = f"49={FIX_SENDER}\x0156={FIX_TARGET}\x01".encode()
+
+# Enum fields pre-encoded as complete "tag=value<SOH>" blobs
+_SIDE_FIELD = {k: b"54=%b\x01" % v for k, v in _SIDE_TO_FIX.items()}
+_ORDER_TYPE_FIELD = {k: b"40=%b\x01" % v for k, v in _ORDER_TYPE_TO_FIX.items()}
+_TIME_IN_FORCE_FIELD = {k: b"59=%b\x01" % v for k, v in _TIME_IN_FORCE_TO_FIX.items()}
+
+
+class _FixWriter:
+    """Outbound FIX message encoder.
+
+    Fields are written straight into a bytearray as they are appended, so
+    encode() only has to prepend 8/9 and append the checksum — no per-pair
+    re-scan or tuple list like simplefix.FixMessage.
+    """
+
+    __slots__ = ("_body",)
+
+    def __init__(self, msg_type: bytes, seq: int, sending_time: bytes):
+        self._body = bytearray(
+            b"35=%b\x01%b34=%d\x0152=%b\x01"
+            % (msg_type, _COMP_ID_FIELDS, seq, sending_time)
+        )
+
+    def append_pair(self, tag: int, value: str | bytes) -> None:
+        if type(value) is str:
+            value = value.encode()
+        self._body += b"%d=%b\x01" % (tag, value)
+
+    def append_raw(self, field: bytes) -> None:
+        """Append an already encoded "tag=value<SOH>" field."""
+        self._body += field
+
+    def encode(self) -> bytes:
+        head = _BEGIN_STRING_FIELD + b"9=%d\x01" % len(self._body)
+        checksum = (sum(head) + sum(self._body)) % 256
+        return head + self._body + b"10=%03d\x01" % checksum
+
+
+# ── FIX inbound framing ──────────────────────────────────────────────────────
+
+FixPairs = list[tuple[bytes, bytes]]
+
+
+class _FixReader:
+    """Incremental inbound FIX framer.
+
+    Buffers raw socket bytes, cuts complete messages using BodyLength (9) and
+    splits each body on SOH in one C-level pass. Messages come back as
+    (tag, value) byte pairs starting at MsgType (35); 8, 9 and 10 are dropped.
+    """
+
+    __slots__ = ("_buf",)
+
+    def __init__(self):
+        self._buf = bytearray()
+
+    def append_buffer(self, data: bytes | bytearray | memoryview) -> None:
+        self._buf += data
+
+    def get_message(self) -> FixPairs | None:
+        buf = self._buf
+        while True:
+            start = buf.find(b"8=")
+            if start == -1:
+                return None
+            if start:
+                del buf[:start]                  # skip bytes before BeginString
+
+            len_tag = buf.find(b"\x019=")
+            if len_tag == -1:
+                return None
+            len_end = buf.find(b"\x01", len_tag + 3)
+            if len_end == -1:
+                return None
+            try:
+                body_end = len_end + 1 + int(buf[len_tag + 3:len_end])
+            except ValueError:
+                del buf[:len_end + 1]            # corrupt header — resync
+                continue
+
+            msg_end = buf.find(b"\x01", body_end)
+            if msg_end == -1:
+                return None
+            if buf[body_end:body_end + 3] != b"10=":
+                del buf[:2]                      # BodyLength lied — resync
+                continue
+
+            body = bytes(buf[len_end + 1:body_end - 1])
+            del buf[:msg_end + 1]
+            pairs: FixPairs = []
+            for field in body.split(b"\x01"):
+                tag, _, value = field.partition(b"=")
+                pairs.append((tag, value))
+            return pairs
+
+
+# ── FIX reader thread — inbound event queues ─────────────────────────────────
+
+# Market data queues drop their oldest entries past this size when nobody
+# polls. Order events are never capped: a lost TRADE would desync Portfolio.
+_MARKET_DATA_EVENTS_MAX = 1_000                  # stale book snapshots are worthless
+_READER_MAX_FAILURES = 10                        # consecutive errors before the reader gives up
+
+
+# ── Shared REST client — one connection pool per process ─────────────────────
+
+_SHARED_HTTP: httpx.AsyncClient | None = None
+
+
+def _get_http() -> httpx.AsyncClient:
+    """Return the process-wide REST client, creating it on first use."""
+    global _SHARED_HTTP
+    if _SHARED_HTTP is None or _SHARED_HTTP.is_closed:
+        _SHARED_HTTP = httpx.AsyncClient(
+            base_url=REST_URL,
+            timeout=httpx.Timeout(10.0, connect=2.0),
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=60.0,
+            ),
+        )
+    return _SHARED_HTTP
+
+
+async def _close_http() -> None:
+    global _SHARED_HTTP
+    if _SHARED_HTTP is not None:
+        await _SHARED_HTTP.aclose()
+        _SHARED_HTTP = None
 
 
 # ── Portfolio — in-memory episode state ───────────────────────────────────────
@@ -150,6 +315,11 @@ _TERMINAL_EXEC_TYPES = {"CANCELED", "REJECTED", "EXPIRED"}
 class Portfolio:
     """Tracks cash, open positions, and fill history for one episode."""
 
+    __slots__ = (
+        "initial_cash", "cash", "locked_cash", "positions", "locked_positions",
+        "active_orders", "fills", "_last_px", "_snapshot", "_profit",
+    )
+
     def __init__(self, initial_cash: float = 15_000.0):
         self.initial_cash = initial_cash
         self.cash = initial_cash
@@ -158,6 +328,9 @@ class Portfolio:
         self.locked_positions: dict[str, int] = {} # {symbol: qty}
         self.active_orders: dict[str, dict] = {} # {order_id: {symbol, side, qty, price}}
         self.fills: list[dict] = []
+        self._last_px: dict[str, float] = {}    # {symbol: last fill price}
+        self._snapshot: dict | None = None      # to_dict() cache; None = stale
+        self._profit: float | None = None       # net_profit() cache; None = stale
 
     def reset(self, initial_cash: float | None = None) -> None:
         if initial_cash is not None:            # NOTE: "if initial_cash:" fails for 0.0
@@ -168,6 +341,9 @@ class Portfolio:
         self.locked_positions = {}
         self.active_orders = {}
         self.fills = []
+        self._last_px = {}
+        self._snapshot = None
+        self._profit = None
 
     def place_order(self, order_id: str, symbol: str, side: str, qty: int, price: float) -> str | None:
         """Lock funds/positions. Returns error string if invalid, else None."""
@@ -184,18 +360,23 @@ class Portfolio:
             self.locked_positions[symbol] = locked + qty
 
         self.active_orders[order_id] = {"symbol": symbol, "side": side, "qty": qty, "price": price}
+        self._snapshot = None
         return None
 
     def cancel_order(self, order_id: str) -> None:
         """Unlock remaining funds/positions for an order. Called via ExecutionReport."""
         order = self.active_orders.pop(order_id, None)
         if order:
+            self._snapshot = None
             if order["side"] == "BUY":
                 self.locked_cash -= order["qty"] * order["price"]
             else:
-                self.locked_positions[order["symbol"]] -= order["qty"]
-                if self.locked_positions[order["symbol"]] <= 0:
-                    self.locked_positions.pop(order["symbol"], None)
+                symbol = order["symbol"]
+                left = self.locked_positions.get(symbol, 0) - order["qty"]
+                if left <= 0:
+                    self.locked_positions.pop(symbol, None)
+                else:
+                    self.locked_positions[symbol] = left
 
     def apply_replacement(
         self,
@@ -210,6 +391,7 @@ class Portfolio:
         order = self.active_orders.pop(original_order_id, None)
         if not order:
             return
+        self._snapshot = None
 
         new_symbol = symbol or order["symbol"]
         new_side = side or order["side"]
@@ -228,11 +410,11 @@ class Portfolio:
         if old_side == "BUY":
             self.locked_cash += (new_qty * new_price) - (old_qty * old_price)
         else:
-            self.locked_positions[old_symbol] = (
-                self.locked_positions.get(old_symbol, 0.0) + (new_qty - old_qty)
-            )
-            if self.locked_positions[old_symbol] <= 0:
+            left = self.locked_positions.get(old_symbol, 0.0) + (new_qty - old_qty)
+            if left <= 0:
                 self.locked_positions.pop(old_symbol, None)
+            else:
+                self.locked_positions[old_symbol] = left
 
         self.active_orders[replacement_order_id] = {
             "symbol": new_symbol,
@@ -242,56 +424,77 @@ class Portfolio:
         }
 
     def record_fill(self, order_id: str, symbol: str, side: str, qty: int, price: float) -> None:
+        self._snapshot = None
+        self._profit = None
+
         # 1. Unlock reserving margin matching the fill qty
         order = self.active_orders.get(order_id)
         if order:
             if side == "BUY":
                 self.locked_cash -= qty * order["price"]
             else:
-                self.locked_positions[symbol] -= qty
-            
-            order["qty"] -= qty
-            if order["qty"] <= 0:
-                self.active_orders.pop(order_id)
+                left = self.locked_positions.get(symbol, 0) - qty
+                if left <= 0:
+                    self.locked_positions.pop(symbol, None)
+                else:
+                    self.locked_positions[symbol] = left
+
+            remaining = order["qty"] - qty
+            if remaining <= 0:
+                del self.active_orders[order_id]
+            else:
+                order["qty"] = remaining
 
         # 2. Apply actual execution to real balances
         self.cash += -(qty * price) if side == "BUY" else (qty * price)
-        pos = self.positions.setdefault(symbol, {"qty": 0, "avg_price": 0.0})
+        pos = self.positions.get(symbol)
+        if pos is None:
+            pos = self.positions[symbol] = {"qty": 0, "avg_price": 0.0}
+        held = pos["qty"]
         if side == "BUY":
-            total = pos["avg_price"] * pos["qty"] + price * qty
-            pos["qty"] += qty
-            pos["avg_price"] = total / pos["qty"]
+            held += qty
+            pos["avg_price"] = (pos["avg_price"] * pos["qty"] + price * qty) / held
+            pos["qty"] = held
         else:
-            pos["qty"] = max(0, pos["qty"] - qty)
-            
+            pos["qty"] = max(0, held - qty)
+
         self.fills.append({"symbol": symbol, "side": side, "qty": qty, "price": price})
+        self._last_px[symbol] = price
 
     def last_price(self, symbol: str) -> float | None:
         """Return the last fill price for a symbol (best proxy for market price)."""
-        for fill in reversed(self.fills):
-            if fill["symbol"] == symbol:
-                return fill["price"]
-        return None
+        return self._last_px.get(symbol)
 
     def net_profit(self) -> float:
         """Net profit using last fill prices for open positions."""
-        value = self.cash
-        for sym, pos in self.positions.items():
-            if pos["qty"] > 0:
-                px = self.last_price(sym)
-                if px:
-                    value += pos["qty"] * px
-        return value - self.initial_cash
+        # Only fills move cash, positions or last prices
+        if self._profit is None:
+            value = self.cash
+            last_px = self._last_px
+            for sym, pos in self.positions.items():
+                if pos["qty"] > 0:
+                    px = last_px.get(sym)
+                    if px:
+                        value += pos["qty"] * px
+            self._profit = value - self.initial_cash
+        return self._profit
 
     def to_dict(self) -> dict:
-        return {
-            "cash":           round(self.cash, 2),
-            "available_cash": round(self.cash - self.locked_cash, 2),
-            "net_profit":     round(self.net_profit(), 2),
-            "positions":      {s: p for s, p in self.positions.items() if p["qty"] > 0},
-            "open_orders":    len(self.active_orders),
-            "total_fills":    len(self.fills),
-        }
+        # Every mutator above clears _snapshot, so between fills/order changes
+        # repeated get_portfolio calls reuse the last result.
+        if self._snapshot is None:
+            self._snapshot = {
+                "cash":           round(self.cash, 2),
+                "available_cash": round(self.cash - self.locked_cash, 2),
+                "net_profit":     round(self.net_profit(), 2),
+                "positions":      {s: p for s, p in self.positions.items() if p["qty"] > 0},
+                "open_orders":    len(self.active_orders),
+                "total_fills":    len(self.fills),
+            }
+        snapshot = dict(self._snapshot)
+        # Fresh position dicts: callers must not reach the cache or the live positions
+        snapshot["positions"] = {s: dict(p) for s, p in snapshot["positions"].items()}
+        return snapshot
 
 
 # ── QuantReplayClient — REST + FIX ───────────────────────────────────────────
@@ -300,16 +503,32 @@ class QuantReplayClient:
     """Communicates with QuantReplay via REST (admin/listings) and FIX (orders)."""
 
     def __init__(self):
-        self._http = httpx.AsyncClient(base_url=REST_URL, timeout=10.0)
+        self._listing_cache: dict[str, dict] = {}
+        self._symbols_cache: list[str] | None = None
         self._sock: socket.socket | None = None
-        self._parser = simplefix.FixParser()
+        self._selector: selectors.BaseSelector | None = None
+        self._reader: threading.Thread | None = None
+        self._reader_stop = threading.Event()
+        self._rx_buf = bytearray(65536)
+        self._rx_view = memoryview(self._rx_buf)
+        self._parser = _FixReader()
         self._seq = 1
-        self._order_events: list[dict] = []
-        self._market_data_events: list[dict] = []
-        self._security_status_events: list[dict] = []
+        # ClOrdID/ReqID = 4 random hex per client + per-session counter
+        self._id_prefix = os.urandom(2).hex()
+        self._id_seq = 0
+        self._now_cache: tuple[int, bytes] = (-1, b"")
+        self._day_cache: tuple[int, bytes] = (-1, b"")
+        # Filled by the reader thread; deque append/popleft are thread-safe
+        self._order_events: deque[dict] = deque()
+        self._market_data_events: deque[dict] = deque(maxlen=_MARKET_DATA_EVENTS_MAX)
+        self._security_status_events: deque[dict] = deque(maxlen=_MARKET_DATA_EVENTS_MAX)
 
     # ── REST ─────────────────────────────────────────────────────────────────
 
+    @property
+    def _http(self) -> httpx.AsyncClient:
+        return _get_http()
+
     async def health_check(self) -> bool:
         """Returns True if QuantReplay is up and responding."""
         try:
@@ -321,26 +540,37 @@ class QuantReplayClient:
         """Return all tradeable symbols from the XETRA venue.
 
         REST response: {"listings": [{symbol, venueId, ...}, ...]}
+        The symbol universe is static venue config, cached until reset_venue().
         """
-        r = await self._http.get("/api/listings")
-        r.raise_for_status()
-        data = r.json()
-        # Response is {"listings": [...]} — not a flat list
-        items = data.get("listings", data) if isinstance(data, dict) else data
-        return [item.get("symbol", "") for item in items if item.get("symbol")]
+        if self._symbols_cache is None:
+            r = await self._http.get("/api/listings")
+            r.raise_for_status()
+            data = orjson.loads(r.content)
+            # Response is {"listings": [...]} — not a flat list
+            items = data.get("listings", data) if isinstance(data, dict) else data
+            self._symbols_cache = [symbol for item in items if (symbol := item.get("symbol"))]
+        return list(self._symbols_cache)
 
     async def get_listing(self, symbol: str) -> dict:
-        """Return full listing configuration for a symbol."""
-        encoded = quote(symbol, safe="")
-        r = await self._http.get(f"/api/listings/{encoded}")
-        r.raise_for_status()
-        return r.json()
+        """Return full listing configuration for a symbol.
+
+        Listings are static venue config, so results are cached until reset_venue().
+        """
+        listing = self._listing_cache.get(symbol)
+        if listing is None:
+            encoded = quote(symbol, safe="")
+            r = await self._http.get(f"/api/listings/{encoded}")
+            r.raise_for_status()
+            listing = self._listing_cache[symbol] = orjson.loads(r.content)
+        return dict(listing)                     # callers may mutate; keep the cache intact
 
     async def reset_venue(self) -> bool:
         """Reset QuantReplay venue state (clears order book for new episode).
 
         POST /api/reset — resets live market state from database settings.
         """
+        self._listing_cache.clear()
+        self._symbols_cache = None
         try:
             r = await self._http.post("/api/reset")
             return r.status_code == 200
@@ -348,39 +578,63 @@ class QuantReplayClient:
             return False
 
     async def close(self) -> None:
-        await self._http.aclose()
+        """Log out of FIX and release the shared REST connection pool."""
+        self.disconnect()
+        await _close_http()
 
     # ── FIX ──────────────────────────────────────────────────────────────────
 
+    @property
+    def connected(self) -> bool:
+        """True while the FIX session is up; False once the reader thread has exited."""
+        return self._sock is not None and self._reader is not None and self._reader.is_alive()
+
     def connect(self) -> None:
         """Open FIX socket and perform Logon handshake.
 
         FIXT.1.1 Logon requires: EncryptMethod(98), HeartBtInt(108), DefaultApplVerID(1137).
         """
         self._sock = socket.create_connection((FIX_HOST, FIX_PORT), timeout=10)
+        self._tune_socket(self._sock)
         self._sock.settimeout(5.0)
-        msg = self._build("A")                   # Logon
-        msg.append_pair(98, "0")                 # EncryptMethod = None
-        msg.append_pair(108, "30")               # HeartBtInt = 30s
-        msg.append_pair(1137, "9")               # DefaultApplVerID = FIX50SP2
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._sock, selectors.EVENT_READ)
+        msg = self._build(b"A")                  # Logon
+        msg.append_pair(98, b"0")                # EncryptMethod = None
+        msg.append_pair(108, b"30")              # HeartBtInt = 30s
+        msg.append_pair(1137, b"9")              # DefaultApplVerID = FIX50SP2
         self._send(msg)
         # Wait for Logon ACK from server
         self._wait_for_logon()
-        self._sock.settimeout(0.5)               # back to non-blocking-ish for polling
+        self._sock.settimeout(0.5)               # bounds sendall(); reads go through the selector
+        self._reader_stop.clear()
+        self._reader = threading.Thread(target=self._reader_loop, name="fix-reader", daemon=True)
+        self._reader.start()
 
     def disconnect(self) -> None:
+        if self._reader:
+            self._reader_stop.set()
+            self._reader.join(timeout=1.0)
+            self._reader = None
         if self._sock:
             try:
-                self._send(self._build("5"))     # Logout
+                self._send(self._build(b"5"))     # Logout
             except Exception:
                 pass
             self._sock.close()
             self._sock = None
-        self._parser = simplefix.FixParser()
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+        self._parser = _FixReader()
         self._order_events.clear()
         self._market_data_events.clear()
         self._security_status_events.clear()
 
+    def new_order_id(self) -> str:
+        """Return a fresh ClOrdID from this session's prefix + counter."""
+        return self._next_id()
+
     def place_order(
         self,
         symbol: str,
@@ -401,29 +655,30 @@ class QuantReplayClient:
         if qty <= 0:
             raise ValueError("qty must be > 0")
 
-        oid = order_id or uuid.uuid4().hex[:8]
-        msg = self._build("D")
+        oid = order_id or self._next_id()
+        msg = self._build(b"D")
         msg.append_pair(11, oid)                 # ClOrdID
-        msg.append_pair(21, "1")                 # HandlInst = AutoExec
+        msg.append_pair(21, b"1")                # HandlInst = AutoExec
         msg.append_pair(55, symbol)              # Symbol
-        msg.append_pair(54, _SIDE_TO_FIX[side_value])       # Side
+        msg.append_raw(_SIDE_FIELD[side_value])             # Side
         msg.append_pair(38, str(qty))            # OrderQty
-        msg.append_pair(40, _ORDER_TYPE_TO_FIX[order_type_value])
+        msg.append_raw(_ORDER_TYPE_FIELD[order_type_value])
         if order_type_value == "LIMIT":
             msg.append_pair(44, f"{float(price):.4f}")
         msg.append_pair(60, self._now())         # TransactTime (required)
-        msg.append_pair(59, _TIME_IN_FORCE_TO_FIX[tif_value])
+        msg.append_raw(_TIME_IN_FORCE_FIELD[tif_value])
         self._send(msg)
-        logger.info(
-            "NewOrderSingle: %s %s %d @ %s [%s] type=%s tif=%s",
-            side_value,
-            symbol,
-            qty,
-            f"{float(price):.4f}" if price is not None else "MKT",
-            oid,
-            order_type_value,
-            tif_value,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "NewOrderSingle: %s %s %d @ %s [%s] type=%s tif=%s",
+                side_value,
+                symbol,
+                qty,
+                f"{float(price):.4f}" if price is not None else "MKT",
+                oid,
+                order_type_value,
+                tif_value,
+            )
         return oid
 
     def cancel_order(self, order_id: str, symbol: str, side: str) -> None:
@@ -432,11 +687,11 @@ class QuantReplayClient:
         Note: qty NOT required per FIX RoE — only ClOrdID, Side, Symbol, TransactTime.
         """
         side_value = self._normalize_side(side)
-        msg = self._build("F")
-        msg.append_pair(11, uuid.uuid4().hex[:8])  # new ClOrdID for this cancel request
+        msg = self._build(b"F")
+        msg.append_pair(11, self._next_id())        # new ClOrdID for this cancel request
         msg.append_pair(41, order_id)               # OrigClOrdID
         msg.append_pair(55, symbol)
-        msg.append_pair(54, _SIDE_TO_FIX[side_value])
+        msg.append_raw(_SIDE_FIELD[side_value])
         msg.append_pair(60, self._now())             # TransactTime (required)
         self._send(msg)
 
@@ -461,17 +716,17 @@ class QuantReplayClient:
         if qty <= 0:
             raise ValueError("qty must be > 0")
 
-        replacement_id = order_id or uuid.uuid4().hex[:8]
-        msg = self._build("G")
+        replacement_id = order_id or self._next_id()
+        msg = self._build(b"G")
         msg.append_pair(11, replacement_id)     # ClOrdID (new)
         msg.append_pair(41, orig_order_id)      # OrigClOrdID
         msg.append_pair(55, symbol)
-        msg.append_pair(54, _SIDE_TO_FIX[side_value])
+        msg.append_raw(_SIDE_FIELD[side_value])
         msg.append_pair(38, str(qty))
-        msg.append_pair(40, _ORDER_TYPE_TO_FIX[order_type_value])
+        msg.append_raw(_ORDER_TYPE_FIELD[order_type_value])
         if order_type_value == "LIMIT":
             msg.append_pair(44, f"{float(price):.4f}")
-        msg.append_pair(59, _TIME_IN_FORCE_TO_FIX[tif_value])
+        msg.append_raw(_TIME_IN_FORCE_FIELD[tif_value])
         msg.append_pair(60, self._now())
         self._send(msg)
         return replacement_id
@@ -556,12 +811,15 @@ class QuantReplayClient:
           0 = New, 4 = Canceled, 5 = Replaced, 8 = Rejected, C = Expired, F = Trade
         """
         fills: list[dict] = []
-        self._drain_socket()
 
-        remaining: list[dict] = []
-        for event in self._order_events:
+        # Compact non-fill events to the front in place, then requeue them
+        # ahead of anything the reader appended meanwhile.
+        events = self._take_all(self._order_events)
+        keep = 0
+        for event in events:
             if event.get("type") != "execution_report":
-                remaining.append(event)
+                events[keep] = event
+                keep += 1
                 continue
 
             exec_type = event.get("exec_type")
@@ -577,52 +835,44 @@ class QuantReplayClient:
                     "qty": qty_int,
                     "price": price_float,
                 })
-            elif exec_type in _TERMINAL_EXEC_TYPES:
+            elif exec_type in TERMINAL_EXEC_TYPES:
                 fills.append({
                     "order_id": event.get("order_id", ""),
                     "type": "CANCEL",
                 })
             else:
-                remaining.append(event)
+                events[keep] = event
+                keep += 1
 
-        self._order_events = remaining
+        del events[keep:]
+        self._order_events.extendleft(reversed(events))
         return fills
 
     def poll_order_events(self) -> list[dict]:
         """Read detailed order lifecycle events from FIX (35=8, 35=9)."""
-        self._drain_socket()
-        events = self._order_events
-        self._order_events = []
-        return events
+        return self._take_all(self._order_events)
 
     def poll_market_data_events(self) -> list[dict]:
         """Read pending market data events from FIX (35=W/X/Y)."""
-        self._drain_socket()
-        events = self._market_data_events
-        self._market_data_events = []
-        return events
+        return self._take_all(self._market_data_events)
 
     def poll_security_status_events(self) -> list[dict]:
         """Read pending security status events from FIX (35=f/j)."""
-        self._drain_socket()
-        events = self._security_status_events
-        self._security_status_events = []
-        return events
+        return self._take_all(self._security_status_events)
 
     # ── Internal helpers ──────────────────────────────────────────────────────
 
-    def _build(self, msg_type: str) -> simplefix.FixMessage:
-        m = simplefix.FixMessage()
-        m.append_pair(8, "FIXT.1.1")     # BeginString — FIXT transport layer
-        m.append_pair(35, msg_type)
-        m.append_pair(49, FIX_SENDER)    # SenderCompID = CLIENT_XETRA
-        m.append_pair(56, FIX_TARGET)    # TargetCompID = SIM_XETRA
-        m.append_pair(34, str(self._seq))
-        m.append_pair(52, self._now())   # SendingTime
+    def _next_id(self) -> str:
+        self._id_seq += 1
+        return f"{self._id_prefix}{self._id_seq:04x}"
+
+    def _build(self, msg_type: bytes) -> _FixWriter:
+        # Header: 8=FIXT.1.1, 35, 49=CLIENT_XETRA, 56=SIM_XETRA, 34 (MsgSeqNum), 52 (SendingTime)
+        m = _FixWriter(msg_type, self._seq, self._now())
         self._seq += 1
         return m
 
-    def _send(self, msg: simplefix.FixMessage) -> None:
+    def _send(self, msg: _FixWriter) -> None:
         if self._sock:
             self._sock.sendall(msg.encode())
 
@@ -643,9 +893,9 @@ class QuantReplayClient:
         depth_code = self._normalize_market_depth(depth)
         normalized_entry_types = self._normalize_md_entry_types(entry_types)
         request_code = _MD_SUBSCRIPTION_REQUEST_TO_FIX[req_type]
-        req_id = request_id or uuid.uuid4().hex[:8]
+        req_id = request_id or self._next_id()
 
-        msg = self._build("V")
+        msg = self._build(b"V")
         msg.append_pair(262, req_id)                 # MDReqID
         msg.append_pair(263, request_code)           # SubscriptionRequestType
         msg.append_pair(264, depth_code)             # MarketDepth
@@ -657,7 +907,7 @@ class QuantReplayClient:
         for md_type in normalized_entry_types:
             msg.append_pair(269, _MD_ENTRY_TYPE_TO_FIX[md_type])
 
-        msg.append_pair(146, "1")                    # NoRelatedSym
+        msg.append_pair(146, b"1")                   # NoRelatedSym
         msg.append_pair(55, symbol)
         self._send(msg)
         return req_id
@@ -673,42 +923,75 @@ class QuantReplayClient:
         if req_type not in _SECURITY_SUBSCRIPTION_REQUEST_TO_FIX:
             raise ValueError(f"unsupported request_type: {request_type}")
 
-        req_id = request_id or uuid.uuid4().hex[:8]
-        msg = self._build("e")
+        req_id = request_id or self._next_id()
+        msg = self._build(b"e")
         msg.append_pair(324, req_id)                                   # SecurityStatusReqID
         msg.append_pair(55, symbol)
         msg.append_pair(263, _SECURITY_SUBSCRIPTION_REQUEST_TO_FIX[req_type])  # SubscriptionRequestType
         self._send(msg)
         return req_id
 
-    def _drain_socket(self) -> None:
-        if not self._sock:
-            return
-
-        self._sock.setblocking(False)
+    @staticmethod
+    def _take_all(events: deque[dict]) -> list[dict]:
+        """Pop everything queued so far without racing the reader thread."""
+        taken = []
         try:
             while True:
-                try:
-                    data = self._sock.recv(4096)
-                except BlockingIOError:
-                    break
-                except socket.timeout:
-                    break
-
-                if not data:
-                    break
-
-                self._parser.append_buffer(data)
-                while msg := self._parser.get_message():
-                    self._route_incoming_message(msg)
-        except OSError:
-            pass
-        finally:
-            self._sock.setblocking(True)
-            self._sock.settimeout(0.5)
-
-    def _route_incoming_message(self, msg: simplefix.FixMessage) -> None:
-        msg_type = self._decode_bytes(msg.get(35))
+                taken.append(events.popleft())
+        except IndexError:
+            return taken
+
+    def _reader_loop(self) -> None:
+        """Own the receive side of the FIX socket until disconnect()."""
+        failures = 0
+        while not self._reader_stop.is_set():
+            try:
+                if self._selector.select(timeout=0.1) and not self._drain_socket():
+                    logger.warning("FIX connection closed by peer")
+                    return
+                failures = 0
+            except Exception as exc:
+                if self._reader_stop.is_set():
+                    return                       # disconnect() closed the socket under us
+                if isinstance(exc, OSError):     # e.g. ConnectionResetError: session is gone
+                    logger.error("FIX reader lost the connection: %r", exc)
+                    return
+                failures += 1
+                logger.exception("FIX reader failed to process inbound data")
+                if failures >= _READER_MAX_FAILURES:
+                    logger.error("FIX reader stopping after %d consecutive failures", failures)
+                    return
+                # Back off so a persistent error doesn't spin a core; wakes early on disconnect()
+                self._reader_stop.wait(min(1.0, 0.01 * 2 ** failures))
+
+    def _drain_socket(self) -> bool:
+        """Read and route everything currently buffered. False once the peer has closed."""
+        # Only recv when the selector reports the socket readable, so the
+        # socket never has to be flipped in and out of non-blocking mode.
+        while self._selector.select(timeout=0):
+            try:
+                n = self._sock.recv_into(self._rx_view)
+            except (BlockingIOError, socket.timeout):
+                break
+
+            if not n:
+                return False
+
+            self._parser.append_buffer(self._rx_view[:n])
+            while msg := self._parser.get_message():
+                self._route_incoming_message(msg)
+        return True
+
+    @staticmethod
+    def _tune_socket(sock: socket.socket) -> None:
+        """Disable Nagle (FIX messages are tiny) and size the kernel buffers."""
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if FIX_SOCK_BUF > 0:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, FIX_SOCK_BUF)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, FIX_SOCK_BUF)
+
+    def _route_incoming_message(self, msg: FixPairs) -> None:
+        msg_type = self._decode_bytes(msg[0][1]) if msg[0][0] == b"35" else ""
         if not msg_type:
             return
 
@@ -725,104 +1008,120 @@ class QuantReplayClient:
         elif msg_type == "j":
             self._security_status_events.append(self._parse_business_reject(msg))
 
-    def _parse_execution_report(self, msg: simplefix.FixMessage) -> dict:
-        pairs = self._decode_pairs(msg)
-        cl_ord_id = self._first_tag(pairs, "11")
-        orig_cl_ord_id = self._first_tag(pairs, "41")
-        venue_order_id = self._first_tag(pairs, "37")
-        exec_type_code = self._first_tag(pairs, "150")
-        ord_status_code = self._first_tag(pairs, "39")
+    def _parse_execution_report(self, msg: FixPairs) -> dict:
+        fields = self._index_tags(msg)
+        text = self._decode_bytes
+        cl_ord_id = text(fields.get(b"11"))
+        orig_cl_ord_id = text(fields.get(b"41"))
+        venue_order_id = text(fields.get(b"37"))
+        exec_type_code = text(fields.get(b"150"))
+        ord_status_code = text(fields.get(b"39"))
+        side_code = text(fields.get(b"54"))
+        exec_type = _FIX_EXEC_TYPE_TO_TEXT.get(exec_type_code, exec_type_code)
+        order_qty = self._to_float(fields.get(b"38"))
+        leaves_qty = self._to_float(fields.get(b"151"))
+        cum_qty = self._to_float(fields.get(b"14"))
+        if order_qty is None and exec_type == "REPLACED" and leaves_qty is not None and cum_qty is not None:
+            order_qty = leaves_qty + cum_qty     # replace acks may omit OrderQty(38)
 
         event = {
             "type": "execution_report",
             "msg_type": "8",
             "exec_type_code": exec_type_code,
-            "exec_type": _FIX_EXEC_TYPE_TO_TEXT.get(exec_type_code, exec_type_code),
+            "exec_type": exec_type,
             "ord_status_code": ord_status_code,
             "ord_status": _FIX_ORD_STATUS_TO_TEXT.get(ord_status_code, ord_status_code),
             "cl_ord_id": cl_ord_id,
             "orig_cl_ord_id": orig_cl_ord_id,
             "venue_order_id": venue_order_id,
             "order_id": cl_ord_id or orig_cl_ord_id or venue_order_id or "",
-            "exec_id": self._first_tag(pairs, "17"),
-            "symbol": self._first_tag(pairs, "55"),
-            "side": _FIX_SIDE_TO_TEXT.get(self._first_tag(pairs, "54"), self._first_tag(pairs, "54")),
-            "order_type": self._first_tag(pairs, "40"),
-            "time_in_force": self._first_tag(pairs, "59"),
-            "order_price": self._to_float(self._first_tag(pairs, "44")),
-            "order_qty": self._to_float(self._first_tag(pairs, "38")),
-            "leaves_qty": self._to_float(self._first_tag(pairs, "151")),
-            "cum_qty": self._to_float(self._first_tag(pairs, "14")),
-            "last_qty": self._to_float(self._first_tag(pairs, "32")),
-            "last_px": self._to_float(self._first_tag(pairs, "31")),
-            "text": self._first_tag(pairs, "58"),
+            "exec_id": text(fields.get(b"17")),
+            "symbol": text(fields.get(b"55")),
+            "side": _FIX_SIDE_TO_TEXT.get(side_code, side_code),
+            "order_type": text(fields.get(b"40")),
+            "time_in_force": text(fields.get(b"59")),
+            "order_price": self._to_float(fields.get(b"44")),
+            "order_qty": order_qty,
+            "leaves_qty": leaves_qty,
+            "cum_qty": cum_qty,
+            "last_qty": self._to_float(fields.get(b"32")),
+            "last_px": self._to_float(fields.get(b"31")),
+            "text": text(fields.get(b"58")),
         }
         return event
 
-    def _parse_cancel_reject(self, msg: simplefix.FixMessage) -> dict:
-        pairs = self._decode_pairs(msg)
-        response_to = self._first_tag(pairs, "434")
+    def _parse_cancel_reject(self, msg: FixPairs) -> dict:
+        fields = self._index_tags(msg)
+        text = self._decode_bytes
+        response_to = text(fields.get(b"434"))
         response_text = {
             "1": "CANCEL_REQUEST",
             "2": "REPLACE_REQUEST",
         }.get(response_to, response_to)
+        cl_ord_id = text(fields.get(b"11"))
+        orig_cl_ord_id = text(fields.get(b"41"))
+        ord_status_code = text(fields.get(b"39"))
         return {
             "type": "order_cancel_reject",
             "msg_type": "9",
-            "cl_ord_id": self._first_tag(pairs, "11"),
-            "orig_cl_ord_id": self._first_tag(pairs, "41"),
-            "venue_order_id": self._first_tag(pairs, "37"),
-            "order_id": self._first_tag(pairs, "11") or self._first_tag(pairs, "41") or "",
-            "ord_status_code": self._first_tag(pairs, "39"),
-            "ord_status": _FIX_ORD_STATUS_TO_TEXT.get(self._first_tag(pairs, "39"), self._first_tag(pairs, "39")),
+            "cl_ord_id": cl_ord_id,
+            "orig_cl_ord_id": orig_cl_ord_id,
+            "venue_order_id": text(fields.get(b"37")),
+            "order_id": cl_ord_id or orig_cl_ord_id or "",
+            "ord_status_code": ord_status_code,
+            "ord_status": _FIX_ORD_STATUS_TO_TEXT.get(ord_status_code, ord_status_code),
             "response_to_code": response_to,
             "response_to": response_text,
-            "text": self._first_tag(pairs, "58"),
+            "text": text(fields.get(b"58")),
         }
 
-    def _parse_market_data_update(self, msg: simplefix.FixMessage, msg_type: str) -> dict:
-        pairs = self._decode_pairs(msg)
+    def _parse_market_data_update(self, msg: FixPairs, msg_type: str) -> dict:
+        fields = self._index_tags(msg)
+        text = self._decode_bytes
         event = {
             "type": "market_data_snapshot" if msg_type == "W" else "market_data_update",
             "msg_type": msg_type,
-            "request_id": self._first_tag(pairs, "262"),
-            "symbol": self._first_tag(pairs, "55"),
-            "last_update_time": self._first_tag(pairs, "779"),
-            "entries": self._parse_md_entries(pairs, msg_type=msg_type),
+            "request_id": text(fields.get(b"262")),
+            "symbol": text(fields.get(b"55")),
+            "last_update_time": text(fields.get(b"779")),
+            "entries": self._parse_md_entries(msg, msg_type=msg_type),
         }
         return event
 
-    def _parse_market_data_reject(self, msg: simplefix.FixMessage) -> dict:
-        pairs = self._decode_pairs(msg)
-        reason_code = self._first_tag(pairs, "281")
+    def _parse_market_data_reject(self, msg: FixPairs) -> dict:
+        fields = self._index_tags(msg)
+        text = self._decode_bytes
+        reason_code = text(fields.get(b"281"))
         return {
             "type": "market_data_reject",
             "msg_type": "Y",
-            "request_id": self._first_tag(pairs, "262"),
+            "request_id": text(fields.get(b"262")),
             "reason_code": reason_code,
             "reason": _FIX_MD_REJECT_REASON_TO_TEXT.get(reason_code, reason_code),
-            "text": self._first_tag(pairs, "58"),
+            "text": text(fields.get(b"58")),
         }
 
-    def _parse_security_status(self, msg: simplefix.FixMessage) -> dict:
-        pairs = self._decode_pairs(msg)
-        phase_code = self._first_tag(pairs, "625")
-        status_code = self._first_tag(pairs, "326")
+    def _parse_security_status(self, msg: FixPairs) -> dict:
+        fields = self._index_tags(msg)
+        text = self._decode_bytes
+        phase_code = text(fields.get(b"625"))
+        status_code = text(fields.get(b"326"))
         return {
             "type": "security_status",
             "msg_type": "f",
-            "request_id": self._first_tag(pairs, "324"),
-            "symbol": self._first_tag(pairs, "55"),
-            "trading_session_id": self._first_tag(pairs, "336"),
+            "request_id": text(fields.get(b"324")),
+            "symbol": text(fields.get(b"55")),
+            "trading_session_id": text(fields.get(b"336")),
             "trading_phase_code": phase_code,
             "trading_phase": _FIX_TRADING_PHASE_TO_TEXT.get(phase_code, phase_code),
             "trading_status_code": status_code,
             "trading_status": _FIX_SECURITY_STATUS_TO_TEXT.get(status_code, status_code),
         }
 
-    def _parse_business_reject(self, msg: simplefix.FixMessage) -> dict:
-        pairs = self._decode_pairs(msg)
-        reason_code = self._first_tag(pairs, "380")
+    def _parse_business_reject(self, msg: FixPairs) -> dict:
+        fields = self._index_tags(msg)
+        text = self._decode_bytes
+        reason_code = text(fields.get(b"380"))
         reason = {
             "0": "OTHER",
             "1": "UNKNOWN_ID",
@@ -831,95 +1130,91 @@ class QuantReplayClient:
         return {
             "type": "business_reject",
             "msg_type": "j",
-            "ref_msg_type": self._first_tag(pairs, "372"),
-            "ref_seq_num": self._first_tag(pairs, "45"),
-            "ref_id": self._first_tag(pairs, "379"),
+            "ref_msg_type": text(fields.get(b"372")),
+            "ref_seq_num": text(fields.get(b"45")),
+            "ref_id": text(fields.get(b"379")),
             "reason_code": reason_code,
             "reason": reason,
-            "text": self._first_tag(pairs, "58"),
+            "text": text(fields.get(b"58")),
         }
 
-    def _parse_md_entries(self, pairs: list[tuple[str, str]], *, msg_type: str) -> list[dict]:
-        boundary_tag = "269" if msg_type == "W" else "279"
+    def _parse_md_entries(self, pairs: FixPairs, *, msg_type: str) -> list[dict]:
+        # Tags stay bytes; only values that end up in an entry are decoded.
+        boundary_tag = b"269" if msg_type == "W" else b"279"
         entries: list[dict] = []
         current: dict | None = None
+        field_for = _MD_ENTRY_FIELDS.get
+        to_float = self._to_float
 
-        for tag, value in pairs:
+        for tag, raw in pairs:
             if tag == boundary_tag:
                 if current is not None:
                     entries.append(current)
                 current = {}
+                value = raw.decode(errors="ignore")
                 if msg_type == "W":
                     current["entry_type_code"] = value
-                    current["entry_type"] = _FIX_MD_ENTRY_TYPE_TO_TEXT.get(value, value)
+                    current["entry_type"] = _md_entry_type_text(value, value)
                 else:
                     current["action_code"] = value
-                    current["action"] = _FIX_MD_UPDATE_ACTION_TO_TEXT.get(value, value)
+                    current["action"] = _md_update_action_text(value, value)
                 continue
 
             if current is None:
                 continue
 
-            if tag == "269":
-                current["entry_type_code"] = value
-                current["entry_type"] = _FIX_MD_ENTRY_TYPE_TO_TEXT.get(value, value)
-            elif tag == "278":
-                current["entry_id"] = value
-            elif tag == "270":
-                current["price"] = self._to_float(value)
-            elif tag == "271":
-                current["size"] = self._to_float(value)
-            elif tag == "272":
-                current["trade_date"] = value
-            elif tag == "273":
-                current["trade_time"] = value
-            elif tag == "288":
-                current["buyer_id"] = value
-            elif tag == "289":
-                current["seller_id"] = value
-            elif tag == "2446":
-                current["aggressor_side_code"] = value
-                current["aggressor_side"] = _FIX_SIDE_TO_TEXT.get(value, value)
-            elif tag == "326":
-                current["trading_status_code"] = value
-                current["trading_status"] = _FIX_SECURITY_STATUS_TO_TEXT.get(value, value)
-            elif tag == "625":
-                current["trading_phase_code"] = value
-                current["trading_phase"] = _FIX_TRADING_PHASE_TO_TEXT.get(value, value)
-            elif tag == "336":
-                current["trading_session_id"] = value
-            elif tag == "277":
-                current["trade_condition"] = value
+            field = field_for(tag)
+            if field is None:
+                continue
+            key, text_key, text_of, numeric = field
+            if numeric:
+                current[key] = to_float(raw)
+            else:
+                value = current[key] = raw.decode(errors="ignore")
+                if text_of is not None:
+                    current[text_key] = text_of(value, value)
 
         if current is not None:
             entries.append(current)
         return entries
 
-    def _normalize_order_type(self, order_type: str) -> str:
+    # Agents send the same few spellings over and over, so each raw string is
+    # normalized once. Invalid input raises every time (exceptions aren't cached).
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _normalize_order_type(order_type: str) -> str:
         key = order_type.strip().upper()
         if key not in _ORDER_TYPE_TO_FIX:
             raise ValueError(f"unsupported order_type: {order_type}")
         return key
 
-    def _normalize_time_in_force(self, time_in_force: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _normalize_time_in_force(time_in_force: str) -> str:
         key = time_in_force.strip().upper()
         if key not in _TIME_IN_FORCE_TO_FIX:
             raise ValueError(f"unsupported time_in_force: {time_in_force}")
         return key
 
-    def _normalize_side(self, side: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _normalize_side(side: str) -> str:
         key = side.strip().upper().replace("-", "_")
         if key not in _SIDE_TO_FIX:
             raise ValueError(f"unsupported side: {side}")
         return key
 
-    def _normalize_market_depth(self, depth: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _normalize_market_depth(depth: str) -> bytes:
         key = depth.strip().upper()
         if key not in _MD_DEPTH_TO_FIX:
             raise ValueError(f"unsupported depth: {depth}")
         return _MD_DEPTH_TO_FIX[key]
 
-    def _normalize_md_update_type(self, update_type: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _normalize_md_update_type(update_type: str) -> bytes:
         key = update_type.strip().upper()
         if key not in _MD_UPDATE_TYPE_TO_FIX:
             raise ValueError(f"unsupported update_type: {update_type}")
@@ -951,43 +1246,50 @@ class QuantReplayClient:
         return value.decode(errors="ignore")
 
     @staticmethod
-    def _decode_pairs(msg: simplefix.FixMessage) -> list[tuple[str, str]]:
-        decoded: list[tuple[str, str]] = []
-        for tag, value in msg.pairs:
-            decoded.append((tag.decode(errors="ignore"), value.decode(errors="ignore")))
-        return decoded
+    def _index_tags(msg: FixPairs) -> dict[bytes, bytes]:
+        """Map raw tag -> raw value in one pass; the first occurrence of a tag wins.
 
-    @staticmethod
-    def _first_tag(pairs: list[tuple[str, str]], tag: str) -> str:
-        for key, value in pairs:
-            if key == tag:
-                return value
-        return ""
+        Values stay bytes so callers only decode the fields they keep.
+        """
+        return dict(reversed(msg))
 
     @staticmethod
-    def _to_float(value: str) -> float | None:
-        if value == "":
+    def _to_float(value: str | bytes | None) -> float | None:
+        if not value:
             return None
         try:
             return float(value)
         except ValueError:
             return None
 
-    def _now(self) -> str:
-        return time.strftime("%Y%m%d-%H:%M:%S", time.gmtime())
+    def _now(self) -> bytes:
+        # UTCTimestamp has 1s resolution here: re-render only when the second
+        # changes, and only call strftime for the YYYYMMDD- prefix once a day.
+        now_s = int(time.time())
+        if now_s != self._now_cache[0]:
+            day, secs = divmod(now_s, 86400)
+            if day != self._day_cache[0]:
+                self._day_cache = (day, time.strftime("%Y%m%d-", time.gmtime(now_s)).encode())
+            hours, rem = divmod(secs, 3600)
+            minutes, seconds = divmod(rem, 60)
+            self._now_cache = (now_s, b"%b%02d:%02d:%02d" % (self._day_cache[1], hours, minutes, seconds))
+        return self._now_cache[1]
 
     def _wait_for_logon(self, timeout: float = 5.0) -> None:
         """Block until we receive a Logon ACK (MsgType=A) from QuantReplay."""
-        deadline = time.time() + timeout
-        while time.time() < deadline:
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            if not self._selector.select(timeout=remaining):
+                break                            # deadline passed with nothing to read
             try:
-                data = self._sock.recv(4096)
-                if data:
-                    self._parser.append_buffer(data)
-                    while msg := self._parser.get_message():
-                        if msg.get(35) == b"A":   # Logon ACK
-                            logger.info("FIX Logon ACK received from %s", FIX_TARGET)
-                            return
+                n = self._sock.recv_into(self._rx_view)
             except socket.timeout:
                 continue
+            if not n:
+                break                            # peer closed the session
+            self._parser.append_buffer(self._rx_view[:n])
+            while msg := self._parser.get_message():
+                if msg[0] == (b"35", b"A"):      # Logon ACK
+                    logger.info("FIX Logon ACK received from %s", FIX_TARGET)
+                    return
         logger.warning("FIX Logon ACK not received within %.1fs — proceeding anyway", timeout)
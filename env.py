@@ -45,7 +45,6 @@ async def initialize() -> None:
 
 @env.shutdown
 async def shutdown() -> None:
-    _client.disconnect()
     await _client.close()
 
 
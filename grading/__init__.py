@@ -12,6 +12,7 @@ from .graders import (
     StepBudgetGrader,
     SymbolsCoveredGrader,
     TradeActivityGrader,
+    grading_pass,
 )
 
 __all__ = [
@@ -29,4 +30,5 @@ __all__ = [
     "PerSymbolProfitGrader",
     "MaxInventoryGrader",
     "StepBudgetGrader",
+    "grading_pass",
 ]
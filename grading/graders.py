@@ -1,41 +1,127 @@
 """grading/graders.py — trading task graders."""
 
-from collections import defaultdict, deque
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
 from math import isfinite
-from typing import Any
+from typing import Any, NamedTuple, TypeVar
 
 from .spec import Grader
 
+_T = TypeVar("_T")
+
+# (symbol, side, qty, price) after the coercions every grader applies
+NormalizedFill = tuple[str, str, float, float]
+
 
 def _clamp(value: float, lower: float = 0.0, upper: float = 1.0) -> float:
     return max(lower, min(upper, value))
 
 
+# Fill-derived results shared by the graders of one Grade; None outside a pass.
+_fills_memo: ContextVar[dict[Callable[..., Any], tuple[list, int, Any]] | None] = ContextVar("_fills_memo", default=None)
+
+
+@contextmanager
+def grading_pass() -> Iterator[None]:
+    """Share fill-derived results between the graders built inside the block.
+
+    Several graders in one Grade read the same portfolio.fills, so each
+    memoized helper runs once per pass. The memo is dropped when the block
+    exits, so nothing outlives the pass or sees a later edit to the fills.
+    """
+    token = _fills_memo.set({})
+    try:
+        yield
+    finally:
+        _fills_memo.reset(token)
+
+
+def _memoize_on_fills(fn: Callable[[list[dict[str, Any]]], _T]) -> Callable[[list[dict[str, Any]]], _T]:
+    """Memo fn(fills) for the current grading_pass(), keyed on the list and its length.
+
+    Outside a pass every call recomputes. Callers must treat the result as
+    read-only. Non-list inputs are never cached.
+    """
+    @wraps(fn)
+    def wrapper(fills: list[dict[str, Any]]) -> _T:
+        memo = _fills_memo.get()
+        if memo is None or not isinstance(fills, list):
+            return fn(fills)
+        hit = memo.get(wrapper)
+        if hit is not None and hit[0] is fills and hit[1] == len(fills):
+            return hit[2]
+        result = fn(fills)
+        memo[wrapper] = (fills, len(fills), result)
+        return result
+
+    return wrapper
+
+
+@_memoize_on_fills
+def _normalized_fills(fills: list[dict[str, Any]]) -> list[NormalizedFill]:
+    """Coerce raw fill dicts once: stripped symbol, upper-case side, float qty and price."""
+    return [
+        (
+            str(fill.get("symbol", "")).strip(),
+            str(fill.get("side", "")).upper(),
+            float(fill.get("qty", 0) or 0),
+            float(fill.get("price", 0) or 0),
+        )
+        for fill in fills
+    ]
+
+
+@_memoize_on_fills
+def _side_counts(fills: list[dict[str, Any]]) -> tuple[int, int]:
+    """(buy fills, sell fills) counted in one pass over the normalized view."""
+    buys = sells = 0
+    for _, side, _, _ in _normalized_fills(fills):
+        if side == "BUY":
+            buys += 1
+        elif side == "SELL":
+            sells += 1
+    return buys, sells
+
+
 def _iter_fifo_matches(fills: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """FIFO-match buy lots against sell fills per symbol."""
-    buy_queues: dict[str, deque[list[float]]] = defaultdict(deque)
+    if not isinstance(fills, list):
+        fills = list(fills)
+    buys, sells = _side_counts(fills)
+    if not buys or not sells:
+        return []                                # nothing can pair up
+
+    # Open buy lots per symbol as parallel qty/price lists. heads[symbol] is
+    # the oldest lot not yet fully consumed, so closing a lot is an index bump.
+    lots: dict[str, tuple[list[float], list[float]]] = {}
+    heads: dict[str, int] = {}
     matches: list[dict[str, Any]] = []
 
-    for fill in fills:
-        symbol = str(fill.get("symbol", "")).strip()
-        side = str(fill.get("side", "")).upper()
-        qty = float(fill.get("qty", 0) or 0)
-        price = float(fill.get("price", 0) or 0)
-
+    for symbol, side, qty, price in _normalized_fills(fills):
         if not symbol or qty <= 0 or price <= 0:
             continue
 
         if side == "BUY":
-            buy_queues[symbol].append([qty, price])
+            book = lots.get(symbol)
+            if book is None:
+                book = lots[symbol] = ([], [])
+                heads[symbol] = 0
+            book[0].append(qty)
+            book[1].append(price)
             continue
 
-        if side != "SELL":
+        if side != "SELL" or symbol not in lots:
             continue
 
+        lot_qtys, lot_prices = lots[symbol]
+        head = heads[symbol]
         remaining = qty
-        queue = buy_queues[symbol]
-        while remaining > 1e-12 and queue:
-            lot_qty, lot_price = queue[0]
+        while remaining > 1e-12 and head < len(lot_qtys):
+            lot_qty = lot_qtys[head]
+            lot_price = lot_prices[head]
             matched_qty = min(remaining, lot_qty)
             pnl = (price - lot_price) * matched_qty
             matches.append(
@@ -51,57 +137,85 @@ def _iter_fifo_matches(fills: list[dict[str, Any]]) -> list[dict[str, Any]]:
             remaining -= matched_qty
             lot_qty -= matched_qty
             if lot_qty <= 1e-12:
-                queue.popleft()
+                head += 1
             else:
-                queue[0][0] = lot_qty
+                lot_qtys[head] = lot_qty
+        heads[symbol] = head
 
     return matches
 
 
+_cached_fifo_matches = _memoize_on_fills(_iter_fifo_matches)
+
+
 def _realized_pnl_per_symbol(fills: list[dict[str, Any]]) -> dict[str, float]:
     realized: dict[str, float] = defaultdict(float)
-    for match in _iter_fifo_matches(fills):
+    for match in _cached_fifo_matches(fills):
         realized[match["symbol"]] += float(match["pnl"])
     return dict(realized)
 
 
-def _max_drawdown_from_fills(fills: list[dict[str, Any]], initial_cash: float) -> float:
-    cash = float(initial_cash)
-    positions: dict[str, float] = defaultdict(float)
-    last_prices: dict[str, float] = {}
+class _PositionScan(NamedTuple):
+    worst_drawdown: float
+    peak_by_symbol: dict[str, float]
+    peak_total_inventory: float
+
 
-    peak_equity = cash
+@_memoize_on_fills
+def _scan_positions(fills: list[dict[str, Any]]) -> _PositionScan:
+    """Replay fills once for both the drawdown and the inventory graders.
+
+    Drawdown is measured on equity relative to the starting cash, so the
+    result does not depend on initial_cash. Only priced fills move the
+    marked book; inventory counts every fill with a symbol and positive qty.
+    """
+    # Drawdown: priced positions, their last prices, and the running sum of
+    # position * last price, so equity never needs a pass over every symbol.
+    marked: dict[str, float] = {}
+    last_prices: dict[str, float] = {}
+    mark_value = 0.0
+    cash_flow = 0.0
+    peak_equity = 0.0
     worst_drawdown = 0.0
 
-    for fill in fills:
-        symbol = str(fill.get("symbol", "")).strip()
-        side = str(fill.get("side", "")).upper()
-        qty = float(fill.get("qty", 0) or 0)
-        price = float(fill.get("price", 0) or 0)
+    # Inventory: positions and peak |position|, with sum |position| kept per fill.
+    positions: dict[str, float] = {}
+    peak_by_symbol: dict[str, float] = {}
+    total_inventory = 0.0
+    peak_total_inventory = 0.0
 
-        if not symbol or qty <= 0 or price <= 0:
+    for symbol, side, qty, price in _normalized_fills(fills):
+        if not symbol or qty <= 0:
             continue
 
-        last_prices[symbol] = price
+        if price > 0:
+            held = marked.get(symbol, 0.0)
+            mark_value += (price - last_prices.get(symbol, price)) * held
+            last_prices[symbol] = price
+
         if side == "BUY":
-            cash -= qty * price
-            positions[symbol] += qty
+            signed_qty = qty
         elif side == "SELL":
-            cash += qty * price
-            positions[symbol] -= qty
+            signed_qty = -qty
         else:
             continue
 
-        equity = cash
-        for pos_symbol, pos_qty in positions.items():
-            if abs(pos_qty) <= 1e-12:
-                continue
-            equity += pos_qty * last_prices.get(pos_symbol, 0.0)
+        held_inventory = positions.get(symbol, 0.0)
+        new = positions[symbol] = held_inventory + signed_qty
+        exposure = abs(new)
+        total_inventory += exposure - abs(held_inventory)
+        peak_by_symbol[symbol] = max(peak_by_symbol.get(symbol, 0.0), exposure)
+        peak_total_inventory = max(peak_total_inventory, total_inventory)
 
-        peak_equity = max(peak_equity, equity)
-        worst_drawdown = max(worst_drawdown, peak_equity - equity)
+        if price > 0:
+            marked[symbol] = held + signed_qty
+            cash_flow -= signed_qty * price
+            mark_value += signed_qty * price
+            equity = cash_flow + mark_value
+            peak_equity = max(peak_equity, equity)
+            worst_drawdown = max(worst_drawdown, peak_equity - equity)
 
-    return worst_drawdown
+    return _PositionScan(worst_drawdown, peak_by_symbol, peak_total_inventory)
 
 
 class PnLGrader(Grader):
@@ -130,8 +244,7 @@ class TradeActivityGrader(Grader):
     @classmethod
     def compute_score(cls, portfolio: Any, **kwargs) -> tuple[float, dict[str, Any]]:
         fills = portfolio.fills
-        buys = sum(1 for fill in fills if str(fill.get("side", "")).upper() == "BUY")
-        sells = sum(1 for fill in fills if str(fill.get("side", "")).upper() == "SELL")
+        buys, sells = _side_counts(fills)
 
         if buys > 0 and sells > 0:
             score = 1.0
@@ -170,7 +283,8 @@ class MaxDrawdownGrader(Grader):
         max_drawdown: float,
         **kwargs,
     ) -> tuple[float, dict[str, Any]]:
-        worst_dd = _max_drawdown_from_fills(list(portfolio.fills), initial_cash=float(initial_cash))
+        # initial_cash shifts every equity point equally, so it cannot move the drawdown
+        worst_dd = _scan_positions(portfolio.fills).worst_drawdown
         if max_drawdown <= 0:
             score = 1.0 if worst_dd <= 0 else 0.0
         elif worst_dd <= max_drawdown:
@@ -194,7 +308,7 @@ class RoundTripGrader(Grader):
         min_profitable_trips: int = 1,
         **kwargs,
     ) -> tuple[float, dict[str, Any]]:
-        matches = _iter_fifo_matches(list(portfolio.fills))
+        matches = _cached_fifo_matches(portfolio.fills)
         profitable = sum(1 for match in matches if float(match["pnl"]) > 0)
         total = len(matches)
         realized = sum(float(match["pnl"]) for match in matches)
@@ -222,13 +336,7 @@ class SymbolsCoveredGrader(Grader):
         min_symbols: int = 1,
         **kwargs,
     ) -> tuple[float, dict[str, Any]]:
-        symbols = sorted(
-            {
-                str(fill.get("symbol", "")).strip()
-                for fill in portfolio.fills
-                if str(fill.get("symbol", "")).strip()
-            }
-        )
+        symbols = sorted({symbol for symbol, _, _, _ in _normalized_fills(portfolio.fills) if symbol})
         count = len(symbols)
         if min_symbols <= 0:
             score = 1.0
@@ -247,7 +355,7 @@ class ProfitFactorGrader(Grader):
         target_profit_factor: float = 1.5,
         **kwargs,
     ) -> tuple[float, dict[str, Any]]:
-        matches = _iter_fifo_matches(list(portfolio.fills))
+        matches = _cached_fifo_matches(portfolio.fills)
         pnls = [float(match["pnl"]) for match in matches]
         gross_profit = sum(pnl for pnl in pnls if pnl > 0)
         gross_loss = sum(-pnl for pnl in pnls if pnl < 0)
@@ -286,7 +394,7 @@ class PerSymbolProfitGrader(Grader):
         min_profit_per_symbol: float = 0.0,
         **kwargs,
     ) -> tuple[float, dict[str, Any]]:
-        pnl_by_symbol = _realized_pnl_per_symbol(list(portfolio.fills))
+        pnl_by_symbol = _realized_pnl_per_symbol(portfolio.fills)
         profitable_symbols = [
             symbol
             for symbol, pnl in pnl_by_symbol.items()
@@ -318,26 +426,9 @@ class MaxInventoryGrader(Grader):
         per_symbol: bool = True,
         **kwargs,
     ) -> tuple[float, dict[str, Any]]:
-        positions: dict[str, float] = defaultdict(float)
-        peak_by_symbol: dict[str, float] = defaultdict(float)
-        peak_total_inventory = 0.0
-
-        for fill in portfolio.fills:
-            symbol = str(fill.get("symbol", "")).strip()
-            side = str(fill.get("side", "")).upper()
-            qty = float(fill.get("qty", 0) or 0)
-            if not symbol or qty <= 0:
-                continue
-
-            if side == "BUY":
-                positions[symbol] += qty
-            elif side == "SELL":
-                positions[symbol] -= qty
-            else:
-                continue
-
-            peak_by_symbol[symbol] = max(peak_by_symbol[symbol], abs(positions[symbol]))
-            peak_total_inventory = max(peak_total_inventory, sum(abs(v) for v in positions.values()))
+        scan = _scan_positions(portfolio.fills)
+        peak_by_symbol = scan.peak_by_symbol
+        peak_total_inventory = scan.peak_total_inventory
 
         peak_inventory = (
             max(peak_by_symbol.values(), default=0.0)
@@ -3,21 +3,25 @@
 Synced with coding-template/grading/spec.py (the canonical HUD spec).
 Key differences from a naive implementation:
   - SubGrade has a `parameters` field (Grader.grade() passes kwargs there)
-  - Grade.score asserts weights sum to 1.0 (so graders must use weights that sum to 1)
+  - Grade asserts weights sum to 1.0 on construction (so graders must use weights that sum to 1)
   - Grader.grade() passes kwargs as `parameters` to SubGrade
 """
 
 import logging
-from dataclasses import dataclass, field
+import math
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import Annotated, Any, Literal
 
-import numpy as np
-
 logger = logging.getLogger(__name__)
 
 ValidateMode = Literal["baseline_fail", "golden_pass"]
 
 
+# Grader names repeat across scenarios; failed checks raise and are not cached.
+@lru_cache(maxsize=256)
 def validate_grader_name(name: str) -> str:
     if not name:
         raise ValueError("Grader name cannot be empty")
@@ -29,8 +33,26 @@ def validate_grader_name(name: str) -> str:
 GraderName = Annotated[str, "A grader name containing only letters, underscores, and hyphens"]
 
 
-@dataclass(kw_only=True, frozen=True)
-class SubGrade:
+def _setstate_then_post_init(self, state: list[Any]) -> None:
+    # Slotted frozen dataclasses pickle/copy only their fields, so the
+    # private cache slot is rebuilt by __post_init__ after a restore.
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
+    self.__post_init__()
+
+
+# The cached values live in a base-class slot rather than a dataclass field,
+# so they stay out of fields(), asdict(), repr() and __init__.
+class _SubGradeSlots:
+    __slots__ = ("_hash",)
+
+
+class _GradeSlots:
+    __slots__ = ("_score",)
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class SubGrade(_SubGradeSlots):
     name: GraderName
     score: float
     weight: float
@@ -39,45 +61,63 @@ class SubGrade:
 
     def __post_init__(self):
         validate_grader_name(self.name)
+        # parameters/metadata are dicts (unhashable), so hash the scalar
+        # fields once; equal SubGrades always agree on these.
+        object.__setattr__(self, "_hash", hash((self.name, self.score, self.weight)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    __setstate__ = _setstate_then_post_init
 
 
-@dataclass(kw_only=True, frozen=True)
-class Grade:
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Grade(_GradeSlots):
     """The grade returned by a scenario."""
 
     subscores: dict[str, float]
     weights: dict[str, float]
     metadata: dict[str, Any] | None
 
+    def __post_init__(self):
+        # Validated and computed once at construction; the instance is frozen.
+        object.__setattr__(self, "_score", self._compute_score())
+
     @property
     def score(self):
+        return self._score
+
+    __setstate__ = _setstate_then_post_init
+
+    def _compute_score(self) -> float:
         assert self.subscores.keys() == self.weights.keys()
-        assert np.isclose(sum(self.weights.values()), 1), \
-            f"Weights must sum to 1.0, got {sum(self.weights.values())}"
+        weight_sum = math.fsum(self.weights.values())
+        # Same tolerance np.isclose(weight_sum, 1) applied: atol 1e-8 + rtol 1e-5
+        assert abs(weight_sum - 1.0) <= 1e-8 + 1e-5, \
+            f"Weights must sum to 1.0, got {weight_sum}"
         assert min(self.subscores.values()) >= 0
         assert max(self.subscores.values()) <= 1
 
-        score = sum([self.subscores[key] * self.weights[key] for key in self.subscores.keys()])
-        return np.clip(score, 0.0, 1.0)
+        weights = self.weights
+        score = sum(value * weights[key] for key, value in self.subscores.items())
+        return float(min(1.0, max(0.0, score)))
 
     @staticmethod
     def from_subscores(subscores: list[SubGrade]) -> "Grade":
         # Handle duplicate names (suffix -1, -2, ...)
-        name_counts: dict[str, int] = {}
-        for sg in subscores:
-            name_counts[sg.name] = name_counts.get(sg.name, 0) + 1
+        name_counts = Counter(sg.name for sg in subscores)
 
         subscores_dict = {}
         weights_dict = {}
         metadata_dict = {}
-        name_usage: dict[str, int] = {}
+        name_usage: Counter[str] = Counter()
 
         for sg in subscores:
             original_name = sg.name
             if name_counts[original_name] == 1:
                 final_name = original_name
             else:
-                name_usage[original_name] = name_usage.get(original_name, 0) + 1
+                name_usage[original_name] += 1
                 final_name = f"{original_name}-{name_usage[original_name]}"
 
             subscores_dict[final_name] = sg.score
@@ -88,6 +128,12 @@ class Grade:
         return Grade(subscores=subscores_dict, weights=weights_dict, metadata=metadata_dict)
 
 
+# Exact-type set for the common case; the isinstance fallback keeps
+# subclasses (e.g. numpy.float64, IntEnum) that the tuple check accepted.
+_SAFE_PARAM_BASES = (str, int, float, bool, type(None))
+_SAFE_PARAM_TYPES = frozenset(_SAFE_PARAM_BASES)
+
+
 class Grader:
     name: str = "BaseGrader"
 
@@ -105,8 +151,10 @@ class Grader:
         # Only store JSON-safe primitives in parameters.
         # Portfolio and other objects are not hashable and would break
         # the frozen dataclass hash computation.
-        _safe_types = (str, int, float, bool, type(None))
-        safe_params = {k: v for k, v in kwargs.items() if isinstance(v, _safe_types)}
+        safe_params = {
+            k: v for k, v in kwargs.items()
+            if type(v) in _SAFE_PARAM_TYPES or isinstance(v, _SAFE_PARAM_BASES)
+        }
 
         return SubGrade(
             name=cls.name,
@@ -124,25 +172,29 @@ class Grader:
     @classmethod
     def any(cls, weight: float, subgrades: list[SubGrade]) -> SubGrade:
         """Return a SubGrade that passes if any of the subgrades pass."""
-        max_score = max(sg.score for sg in subgrades)
-        return SubGrade(
-            name=f"{cls.name}_any",
-            score=max_score,
-            weight=weight,
-            parameters={"subgrades": [sg.name for sg in subgrades]},
-            metadata={"subgrades": [sg.name for sg in subgrades],
-                      "subgrade_metadata": {sg.name: sg.metadata for sg in subgrades if sg.metadata}},
-        )
+        return cls._combine("any", max, weight, subgrades)
 
     @classmethod
     def all(cls, weight: float, subgrades: list[SubGrade]) -> SubGrade:
         """Return a SubGrade that passes only if all subgrades pass."""
-        min_score = min(sg.score for sg in subgrades)
+        return cls._combine("all", min, weight, subgrades)
+
+    @classmethod
+    def _combine(cls, mode: str, pick: Callable[[list[float]], float], weight: float, subgrades: list[SubGrade]) -> SubGrade:
+        # One pass collects scores, names and non-empty metadata.
+        scores: list[float] = []
+        names: list[str] = []
+        subgrade_metadata: dict[str, Any] = {}
+        for sg in subgrades:
+            scores.append(sg.score)
+            names.append(sg.name)
+            if sg.metadata:
+                subgrade_metadata[sg.name] = sg.metadata
+
         return SubGrade(
-            name=f"{cls.name}_all",
-            score=min_score,
+            name=f"{cls.name}_{mode}",
+            score=pick(scores),
             weight=weight,
-            parameters={"subgrades": [sg.name for sg in subgrades]},
-            metadata={"subgrades": [sg.name for sg in subgrades],
-                      "subgrade_metadata": {sg.name: sg.metadata for sg in subgrades if sg.metadata}},
+            parameters={"subgrades": names},
+            metadata={"subgrades": list(names), "subgrade_metadata": subgrade_metadata},
         )
@@ -1,6 +1,6 @@
 """tasks/basic_tasks.py — beginner-friendly trading scenarios."""
 
-from grading import Grade, PnLGrader, TradeActivityGrader
+from grading import Grade, PnLGrader, TradeActivityGrader, grading_pass
 
 
 def register(env, client, portfolio):
@@ -20,19 +20,20 @@ Goal: make at least ${target_profit:,.0f} net profit trading {symbol}.
 Use the provided tools to place/cancel orders, poll fills, and track your portfolio.
 Your score is based on your portfolio state (not explanations)."""
 
-        grade = Grade.from_subscores(
-            [
-                PnLGrader.grade(
-                    weight=0.80,
-                    portfolio=portfolio,
-                    initial_cash=initial_cash,
-                    target_profit=target_profit,
-                ),
-                TradeActivityGrader.grade(
-                    weight=0.20,
-                    portfolio=portfolio,
-                ),
-            ]
-        )
+        with grading_pass():
+            grade = Grade.from_subscores(
+                [
+                    PnLGrader.grade(
+                        weight=0.80,
+                        portfolio=portfolio,
+                        initial_cash=initial_cash,
+                        target_profit=target_profit,
+                    ),
+                    TradeActivityGrader.grade(
+                        weight=0.20,
+                        portfolio=portfolio,
+                    ),
+                ]
+            )
         yield grade.score
 
@@ -11,6 +11,7 @@ from grading import (
     RoundTripGrader,
     SymbolsCoveredGrader,
     TradeActivityGrader,
+    grading_pass,
 )
 
 
@@ -35,40 +36,41 @@ Keep peak open position at or below {max_inventory:.0f} shares.
 Keep max drawdown at or below ${max_drawdown:,.0f}.
 End with zero position."""
 
-        grade = Grade.from_subscores([
-            PnLGrader.grade(
-                weight=0.18,
-                portfolio=portfolio,
-                initial_cash=initial_cash,
-                target_profit=target_profit,
-            ),
-            RoundTripGrader.grade(
-                weight=0.24,
-                portfolio=portfolio,
-                min_profitable_trips=min_profitable_trips,
-            ),
-            ProfitFactorGrader.grade(
-                weight=0.22,
-                portfolio=portfolio,
-                target_profit_factor=target_profit_factor,
-            ),
-            MaxInventoryGrader.grade(
-                weight=0.16,
-                portfolio=portfolio,
-                inventory_limit=max_inventory,
-                per_symbol=True,
-            ),
-            MaxDrawdownGrader.grade(
-                weight=0.10,
-                portfolio=portfolio,
-                initial_cash=initial_cash,
-                max_drawdown=max_drawdown,
-            ),
-            EndFlatGrader.grade(
-                weight=0.10,
-                portfolio=portfolio,
-            ),
-        ])
+        with grading_pass():
+            grade = Grade.from_subscores([
+                PnLGrader.grade(
+                    weight=0.18,
+                    portfolio=portfolio,
+                    initial_cash=initial_cash,
+                    target_profit=target_profit,
+                ),
+                RoundTripGrader.grade(
+                    weight=0.24,
+                    portfolio=portfolio,
+                    min_profitable_trips=min_profitable_trips,
+                ),
+                ProfitFactorGrader.grade(
+                    weight=0.22,
+                    portfolio=portfolio,
+                    target_profit_factor=target_profit_factor,
+                ),
+                MaxInventoryGrader.grade(
+                    weight=0.16,
+                    portfolio=portfolio,
+                    inventory_limit=max_inventory,
+                    per_symbol=True,
+                ),
+                MaxDrawdownGrader.grade(
+                    weight=0.10,
+                    portfolio=portfolio,
+                    initial_cash=initial_cash,
+                    max_drawdown=max_drawdown,
+                ),
+                EndFlatGrader.grade(
+                    weight=0.10,
+                    portfolio=portfolio,
+                ),
+            ])
         yield grade.score
 
     @env.scenario("underwater-unwind")
@@ -91,38 +93,39 @@ Keep max drawdown at or below ${max_drawdown:,.0f}.
 Complete at least {min_profitable_trips} profitable round trips.
 End with zero position."""
 
-        grade = Grade.from_subscores([
-            PnLGrader.grade(
-                weight=0.25,
-                portfolio=portfolio,
-                initial_cash=initial_cash,
-                target_profit=target_profit,
-            ),
-            EndFlatGrader.grade(
-                weight=0.20,
-                portfolio=portfolio,
-            ),
-            MaxDrawdownGrader.grade(
-                weight=0.20,
-                portfolio=portfolio,
-                initial_cash=initial_cash,
-                max_drawdown=max_drawdown,
-            ),
-            ProfitFactorGrader.grade(
-                weight=0.20,
-                portfolio=portfolio,
-                target_profit_factor=target_profit_factor,
-            ),
-            RoundTripGrader.grade(
-                weight=0.10,
-                portfolio=portfolio,
-                min_profitable_trips=min_profitable_trips,
-            ),
-            TradeActivityGrader.grade(
-                weight=0.05,
-                portfolio=portfolio,
-            ),
-        ])
+        with grading_pass():
+            grade = Grade.from_subscores([
+                PnLGrader.grade(
+                    weight=0.25,
+                    portfolio=portfolio,
+                    initial_cash=initial_cash,
+                    target_profit=target_profit,
+                ),
+                EndFlatGrader.grade(
+                    weight=0.20,
+                    portfolio=portfolio,
+                ),
+                MaxDrawdownGrader.grade(
+                    weight=0.20,
+                    portfolio=portfolio,
+                    initial_cash=initial_cash,
+                    max_drawdown=max_drawdown,
+                ),
+                ProfitFactorGrader.grade(
+                    weight=0.20,
+                    portfolio=portfolio,
+                    target_profit_factor=target_profit_factor,
+                ),
+                RoundTripGrader.grade(
+                    weight=0.10,
+                    portfolio=portfolio,
+                    min_profitable_trips=min_profitable_trips,
+                ),
+                TradeActivityGrader.grade(
+                    weight=0.05,
+                    portfolio=portfolio,
+                ),
+            ])
         yield grade.score
 
     @env.scenario("balanced-cross-symbol")
@@ -142,40 +145,41 @@ At least {required_profitable_symbols} symbols must each make ${min_profit_per_s
 Keep max drawdown at or below ${max_drawdown:,.0f}.
 End with zero positions."""
 
-        grade = Grade.from_subscores([
-            PnLGrader.grade(
-                weight=0.20,
-                portfolio=portfolio,
-                initial_cash=initial_cash,
-                target_profit=target_profit,
-            ),
-            SymbolsCoveredGrader.grade(
-                weight=0.20,
-                portfolio=portfolio,
-                min_symbols=min_symbols,
-            ),
-            PerSymbolProfitGrader.grade(
-                weight=0.25,
-                portfolio=portfolio,
-                required_symbols=required_profitable_symbols,
-                min_profit_per_symbol=min_profit_per_symbol,
-            ),
-            MaxDrawdownGrader.grade(
-                weight=0.15,
-                portfolio=portfolio,
-                initial_cash=initial_cash,
-                max_drawdown=max_drawdown,
-            ),
-            EndFlatGrader.grade(
-                weight=0.10,
-                portfolio=portfolio,
-            ),
-            ProfitFactorGrader.grade(
-                weight=0.10,
-                portfolio=portfolio,
-                target_profit_factor=1.4,
-            ),
-        ])
+        with grading_pass():
+            grade = Grade.from_subscores([
+                PnLGrader.grade(
+                    weight=0.20,
+                    portfolio=portfolio,
+                    initial_cash=initial_cash,
+                    target_profit=target_profit,
+                ),
+                SymbolsCoveredGrader.grade(
+                    weight=0.20,
+                    portfolio=portfolio,
+                    min_symbols=min_symbols,
+                ),
+                PerSymbolProfitGrader.grade(
+                    weight=0.25,
+                    portfolio=portfolio,
+                    required_symbols=required_profitable_symbols,
+                    min_profit_per_symbol=min_profit_per_symbol,
+                ),
+                MaxDrawdownGrader.grade(
+                    weight=0.15,
+                    portfolio=portfolio,
+                    initial_cash=initial_cash,
+                    max_drawdown=max_drawdown,
+                ),
+                EndFlatGrader.grade(
+                    weight=0.10,
+                    portfolio=portfolio,
+                ),
+                ProfitFactorGrader.grade(
+                    weight=0.10,
+                    portfolio=portfolio,
+                    target_profit_factor=1.4,
+                ),
+            ])
         yield grade.score
 
     @env.scenario("small-capital-precision")
@@ -196,40 +200,41 @@ Keep max drawdown at or below ${max_drawdown:,.0f}.
 Keep peak position at or below {max_inventory:.0f} shares.
 End with zero position."""
 
-        grade = Grade.from_subscores([
-            PnLGrader.grade(
-                weight=0.20,
-                portfolio=portfolio,
-                initial_cash=initial_cash,
-                target_profit=target_profit,
-            ),
-            RoundTripGrader.grade(
-                weight=0.20,
-                portfolio=portfolio,
-                min_profitable_trips=min_profitable_trips,
-            ),
-            ProfitFactorGrader.grade(
-                weight=0.20,
-                portfolio=portfolio,
-                target_profit_factor=target_profit_factor,
-            ),
-            MaxDrawdownGrader.grade(
-                weight=0.20,
-                portfolio=portfolio,
-                initial_cash=initial_cash,
-                max_drawdown=max_drawdown,
-            ),
-            MaxInventoryGrader.grade(
-                weight=0.10,
-                portfolio=portfolio,
-                inventory_limit=max_inventory,
-                per_symbol=True,
-            ),
-            EndFlatGrader.grade(
-                weight=0.10,
-                portfolio=portfolio,
-            ),
-        ])
+        with grading_pass():
+            grade = Grade.from_subscores([
+                PnLGrader.grade(
+                    weight=0.20,
+                    portfolio=portfolio,
+                    initial_cash=initial_cash,
+                    target_profit=target_profit,
+                ),
+                RoundTripGrader.grade(
+                    weight=0.20,
+                    portfolio=portfolio,
+                    min_profitable_trips=min_profitable_trips,
+                ),
+                ProfitFactorGrader.grade(
+                    weight=0.20,
+                    portfolio=portfolio,
+                    target_profit_factor=target_profit_factor,
+                ),
+                MaxDrawdownGrader.grade(
+                    weight=0.20,
+                    portfolio=portfolio,
+                    initial_cash=initial_cash,
+                    max_drawdown=max_drawdown,
+                ),
+                MaxInventoryGrader.grade(
+                    weight=0.10,
+                    portfolio=portfolio,
+                    inventory_limit=max_inventory,
+                    per_symbol=True,
+                ),
+                EndFlatGrader.grade(
+                    weight=0.10,
+                    portfolio=portfolio,
+                ),
+            ])
         yield grade.score
 
     @env.scenario("quant-gauntlet-hard")
@@ -255,49 +260,50 @@ Keep max drawdown at or below ${max_drawdown:,.0f}.
 Keep peak position per symbol at or below {max_inventory:.0f} shares.
 End with zero positions."""
 
-        grade = Grade.from_subscores([
-            PnLGrader.grade(
-                weight=0.18,
-                portfolio=portfolio,
-                initial_cash=initial_cash,
-                target_profit=target_profit,
-            ),
-            SymbolsCoveredGrader.grade(
-                weight=0.12,
-                portfolio=portfolio,
-                min_symbols=min_symbols,
-            ),
-            PerSymbolProfitGrader.grade(
-                weight=0.12,
-                portfolio=portfolio,
-                required_symbols=required_profitable_symbols,
-                min_profit_per_symbol=min_profit_per_symbol,
-            ),
-            RoundTripGrader.grade(
-                weight=0.14,
-                portfolio=portfolio,
-                min_profitable_trips=min_profitable_trips,
-            ),
-            ProfitFactorGrader.grade(
-                weight=0.14,
-                portfolio=portfolio,
-                target_profit_factor=target_profit_factor,
-            ),
-            MaxDrawdownGrader.grade(
-                weight=0.14,
-                portfolio=portfolio,
-                initial_cash=initial_cash,
-                max_drawdown=max_drawdown,
-            ),
-            MaxInventoryGrader.grade(
-                weight=0.08,
-                portfolio=portfolio,
-                inventory_limit=max_inventory,
-                per_symbol=True,
-            ),
-            EndFlatGrader.grade(
-                weight=0.08,
-                portfolio=portfolio,
-            ),
-        ])
+        with grading_pass():
+            grade = Grade.from_subscores([
+                PnLGrader.grade(
+                    weight=0.18,
+                    portfolio=portfolio,
+                    initial_cash=initial_cash,
+                    target_profit=target_profit,
+                ),
+                SymbolsCoveredGrader.grade(
+                    weight=0.12,
+                    portfolio=portfolio,
+                    min_symbols=min_symbols,
+                ),
+                PerSymbolProfitGrader.grade(
+                    weight=0.12,
+                    portfolio=portfolio,
+                    required_symbols=required_profitable_symbols,
+                    min_profit_per_symbol=min_profit_per_symbol,
+                ),
+                RoundTripGrader.grade(
+                    weight=0.14,
+                    portfolio=portfolio,
+                    min_profitable_trips=min_profitable_trips,
+                ),
+                ProfitFactorGrader.grade(
+                    weight=0.14,
+                    portfolio=portfolio,
+                    target_profit_factor=target_profit_factor,
+                ),
+                MaxDrawdownGrader.grade(
+                    weight=0.14,
+                    portfolio=portfolio,
+                    initial_cash=initial_cash,
+                    max_drawdown=max_drawdown,
+                ),
+                MaxInventoryGrader.grade(
+                    weight=0.08,
+                    portfolio=portfolio,
+                    inventory_limit=max_inventory,
+                    per_symbol=True,
+                ),
+                EndFlatGrader.grade(
+                    weight=0.08,
+                    portfolio=portfolio,
+                ),
+            ])
         yield grade.score
@@ -61,15 +61,19 @@ def fix_now():
     return time.strftime("%Y%m%d-%H:%M:%S", time.gmtime())
 
 
+def send_batch(sock, msgs):
+    """Encode several FIX messages and write them with one sendall()."""
+    sock.sendall(b"".join(m.encode() for m in msgs))
+
+
 # ── Layer 1 — REST API ───────────────────────────────────────────────────────
 async def test_rest():
     print("\n══ Layer 1: QuantReplay REST API ══")
     async with httpx.AsyncClient(base_url=REST_URL, timeout=10) as c:
 
-        r = await c.get("/api/venuestatus")
-        check("GET /api/venuestatus → 200", r.status_code == 200)
-
-        r = await c.get("/api/listings")
+        # Independent probes — fire both at once
+        status, r = await asyncio.gather(c.get("/api/venuestatus"), c.get("/api/listings"))
+        check("GET /api/venuestatus → 200", status.status_code == 200)
         check("GET /api/listings → 200", r.status_code == 200)
         data = r.json()
         # Response: {"listings": [{symbol, ...}, ...]}
@@ -98,6 +102,7 @@ def test_fix():
 
     try:
         sock = socket.create_connection((FIX_HOST, FIX_PORT), timeout=5)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # small messages, no Nagle stall
         sock.settimeout(3.0)
         check("TCP connect to FIX :9051", True)
     except Exception as e:
@@ -166,11 +171,10 @@ def test_fix():
         cancel.append_pair(55, "AMZ")
         cancel.append_pair(54, "1")                    # side
         cancel.append_pair(60, fix_now())              # TransactTime (required)
-        sock.sendall(cancel.encode())
-        check("OrderCancelRequest sent (no qty, with TransactTime)", True)
 
-        # Logout
-        sock.sendall(build("5").encode())
+        # Cancel + Logout go out together; nothing is read back in between
+        send_batch(sock, [cancel, build("5")])
+        check("OrderCancelRequest sent (no qty, with TransactTime)", True)
 
     finally:
         sock.close()
@@ -201,14 +205,17 @@ async def test_mcp_tools():
         print(f"       registered: {sorted(tool_names)}")
         check("all expected tools present", expected_tools.issubset(tool_names))
 
-        r = await env.call_tool("list_symbols")
-        check("list_symbols → symbols list", "symbols" in r and len(r["symbols"]) >= 1)
+        # Read-only tools are independent — call them concurrently
+        r_sym, r_px, r = await asyncio.gather(
+            env.call_tool("list_symbols"),
+            env.call_tool("get_last_price", symbol="AMZ"),
+            env.call_tool("get_portfolio"),
+        )
+        check("list_symbols → symbols list", "symbols" in r_sym and len(r_sym["symbols"]) >= 1)
 
-        r = await env.call_tool("get_last_price", symbol="AMZ")
         check("get_last_price → has symbol+last_price keys",
-              "symbol" in r and "last_price" in r)
+              "symbol" in r_px and "last_price" in r_px)
 
-        r = await env.call_tool("get_portfolio")
         check("get_portfolio → cash field",      "cash" in r)
         check("get_portfolio → net_profit field", "net_profit" in r)
 
@@ -2,9 +2,14 @@
 
 import asyncio
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# market_data_snapshot waits up to this long for the FIX reply before reporting "pending"
+_SNAPSHOT_WAIT_S = 0.5
+_SNAPSHOT_POLL_S = 0.01
+
 
 def register(env, client, portfolio):
     """Register market tools on the env."""
@@ -56,12 +61,28 @@ def register(env, client, portfolio):
         except Exception as exc:
             return {"error": str(exc)}
 
-        events = client.poll_market_data_events()
-        if not any(event.get("request_id") == req_id for event in events):
-            await asyncio.sleep(0.05)
-            events.extend(client.poll_market_data_events())
+        # Each drain only classifies the events it just took; the first reject or
+        # snapshot for this request wins, and a reject outranks a snapshot.
+        matched = False
+        reject = snapshot = None
+        deadline = time.monotonic() + _SNAPSHOT_WAIT_S
+        while True:
+            for event in client.poll_market_data_events():
+                if event.get("request_id") != req_id:
+                    continue
+                matched = True
+                event_type = event.get("type")
+                if event_type == "market_data_reject":
+                    if reject is None:
+                        reject = event
+                elif event_type in ("market_data_snapshot", "market_data_update"):
+                    if snapshot is None:
+                        snapshot = event
+            if reject is not None or snapshot is not None or time.monotonic() >= deadline:
+                break
+            # Long-poll: return as soon as the reply lands instead of after one fixed sleep
+            await asyncio.sleep(_SNAPSHOT_POLL_S)
 
-        matched = [event for event in events if event.get("request_id") == req_id]
         if not matched:
             return {
                 "request_id": req_id,
@@ -70,8 +91,7 @@ def register(env, client, portfolio):
                 "message": "snapshot not received yet; call again",
             }
 
-        reject = next((event for event in matched if event.get("type") == "market_data_reject"), None)
-        if reject:
+        if reject is not None:
             return {
                 "request_id": req_id,
                 "symbol": symbol,
@@ -79,10 +99,6 @@ def register(env, client, portfolio):
                 "details": reject,
             }
 
-        snapshot = next(
-            (event for event in matched if event.get("type") in ("market_data_snapshot", "market_data_update")),
-            None,
-        )
         if snapshot is None:
             return {
                 "request_id": req_id,
@@ -92,13 +108,24 @@ def register(env, client, portfolio):
             }
 
         entries = snapshot.get("entries", [])
-        bids = [entry for entry in entries if entry.get("entry_type") == "BID" and isinstance(entry.get("price"), (float, int))]
-        offers = [entry for entry in entries if entry.get("entry_type") == "OFFER" and isinstance(entry.get("price"), (float, int))]
-        trades = [entry for entry in entries if entry.get("entry_type") == "TRADE" and isinstance(entry.get("price"), (float, int))]
-
-        best_bid = max(bids, key=lambda entry: float(entry["price"])) if bids else None
-        best_ask = min(offers, key=lambda entry: float(entry["price"])) if offers else None
-        last_trade = trades[-1] if trades else None
+        # One pass; strict comparisons keep the first entry on price ties, as max()/min() did.
+        best_bid = best_ask = last_trade = None
+        best_bid_price = best_ask_price = 0.0
+        for entry in entries:
+            price = entry.get("price")
+            if not isinstance(price, (float, int)):
+                continue
+            entry_type = entry.get("entry_type")
+            if entry_type == "BID":
+                price = float(price)
+                if best_bid is None or price > best_bid_price:
+                    best_bid, best_bid_price = entry, price
+            elif entry_type == "OFFER":
+                price = float(price)
+                if best_ask is None or price < best_ask_price:
+                    best_ask, best_ask_price = entry, price
+            elif entry_type == "TRADE":
+                last_trade = entry
 
         return {
             "request_id": req_id,
@@ -1,64 +1,100 @@
 """tools/orders.py — simple order action tools for the agent."""
 
+import asyncio
 import logging
+import time
+
+from backend import TERMINAL_EXEC_TYPES
 
 logger = logging.getLogger(__name__)
 
+# poll_fills keeps draining while fills keep arriving this close together, up to the cap
+_FILL_COALESCE_WINDOW_S = 0.05
+_FILL_COALESCE_CAP_S = 0.5
+
+# place_order waits at most this long for the new order to trade or close, and
+# only a short grace period past its NEW ack (a marketable order's TRADE follows it)
+_ORDER_ACK_WAIT_S = 0.005
+_ORDER_FILL_GRACE_S = 0.002
+_ORDER_ACK_POLL_S = 0.001
+
+_SIDES = frozenset(("BUY", "SELL"))
+
+
+def _normalise_side(side: str) -> str | None:
+    """Return side as BUY/SELL, or None if it is neither."""
+    if side in _SIDES:              # normalise only when the agent didn't send BUY/SELL
+        return side
+    side = side.strip().upper()
+    return side if side in _SIDES else None
+
 
 def register(env, client, portfolio):
     """Register order management tools on the env."""
 
     def _apply_order_events(events: list[dict]) -> list[dict]:
         """Apply FIX order events to local portfolio and return trade fills."""
+        if not events:
+            return []      # quiet market: the common case
         fills: list[dict] = []
+        record_fill = portfolio.record_fill
+        append_fill = fills.append
         for event in events:
             if event.get("type") != "execution_report":
                 continue
 
-            exec_type = event.get("exec_type")
+            # The client's ExecutionReport parser always sets every key, so index
+            # directly. Only these reads are guarded; portfolio updates run below.
+            try:
+                exec_type = event["exec_type"]
+                if exec_type == "TRADE":
+                    order_id = event["order_id"]
+                    qty = int(event["last_qty"] or 0)
+                    price = float(event["last_px"] or 0.0)
+                    symbol = event["symbol"]
+                    side = event["side"]
+                elif exec_type in TERMINAL_EXEC_TYPES:
+                    order_id = event["order_id"]
+                elif exec_type == "REPLACED":
+                    original_id = event["orig_cl_ord_id"]
+                    replacement_id = event["cl_ord_id"]
+                    order_qty = event["order_qty"]          # parser falls back to leaves + cum
+                    order_price = event["order_price"]
+                    symbol = event["symbol"]
+                    side = event["side"]
+            except KeyError as exc:
+                logger.warning("Skipping execution report without %s: %r", exc, event)
+                continue
+
             if exec_type == "TRADE":
-                qty = int(event.get("last_qty") or 0)
-                price = float(event.get("last_px") or 0.0)
-                symbol = event.get("symbol", "")
-                side = event.get("side", "")
-                order_id = event.get("order_id", "")
-                portfolio.record_fill(order_id, symbol, side, qty, price)
-                fills.append({"symbol": symbol, "side": side, "qty": qty, "price": price})
-            elif exec_type in ("CANCELED", "REJECTED", "EXPIRED"):
-                portfolio.cancel_order(event.get("order_id", ""))
+                record_fill(order_id, symbol, side, qty, price)
+                append_fill({"symbol": symbol, "side": side, "qty": qty, "price": price})
+            elif exec_type in TERMINAL_EXEC_TYPES:
+                portfolio.cancel_order(order_id)
             elif exec_type == "REPLACED":
-                original_id = event.get("orig_cl_ord_id", "")
-                replacement_id = event.get("cl_ord_id", "")
                 if original_id and replacement_id and original_id != replacement_id:
-                    order_qty = event.get("order_qty")
-                    if order_qty is None:
-                        leaves_qty = event.get("leaves_qty")
-                        cum_qty = event.get("cum_qty")
-                        if isinstance(leaves_qty, (float, int)) and isinstance(cum_qty, (float, int)):
-                            order_qty = leaves_qty + cum_qty
                     portfolio.apply_replacement(
                         original_id,
                         replacement_id,
                         qty=order_qty,
-                        price=event.get("order_price"),
-                        symbol=event.get("symbol") or None,
-                        side=event.get("side") or None,
+                        price=order_price,
+                        symbol=symbol or None,
+                        side=side or None,
                     )
         return fills
 
     @env.tool()
     async def place_order(symbol: str, side: str, qty: int, price: float) -> dict:
         """Place a DAY LIMIT order."""
-        side = side.strip().upper()
-        if side not in ("BUY", "SELL"):
+        side = _normalise_side(side)
+        if side is None:
             return {"error": "side must be 'BUY' or 'SELL'"}
         if qty <= 0:
             return {"error": "qty must be a positive integer"}
         if price <= 0:
             return {"error": "price must be positive"}
 
-        import uuid
-        order_id = uuid.uuid4().hex[:8]
+        order_id = client.new_order_id()
 
         err = portfolio.place_order(order_id, symbol, side, qty, float(price))
         if err:
@@ -78,15 +114,36 @@ def register(env, client, portfolio):
             portfolio.cancel_order(order_id)
             return {"error": f"failed to send order: {exc}"}
 
+        # Poll briefly so marketable orders report their fills now. Sleeping (not
+        # spinning) lets the FIX reader thread take the GIL.
         events = client.poll_order_events()
+        deadline = time.monotonic() + _ORDER_ACK_WAIT_S
+        seen = 0
+        acked = settled = False
+        while True:
+            for event in events[seen:]:
+                if event.get("order_id") != order_id:
+                    continue
+                exec_type = event.get("exec_type")
+                if exec_type == "TRADE" or exec_type in TERMINAL_EXEC_TYPES:
+                    settled = True
+                    break
+                if not acked:
+                    acked = True
+                    deadline = min(deadline, time.monotonic() + _ORDER_FILL_GRACE_S)
+            seen = len(events)
+            if settled or time.monotonic() >= deadline:
+                break
+            await asyncio.sleep(_ORDER_ACK_POLL_S)
+            events.extend(client.poll_order_events())
         fills = _apply_order_events(events)
         return {"order_id": order_id, "immediate_fills": len(fills)}
 
     @env.tool()
     async def replace_order(order_id: str, symbol: str, side: str, qty: int, price: float) -> dict:
         """Replace an active order with a new DAY LIMIT price/qty."""
-        side = side.strip().upper()
-        if side not in ("BUY", "SELL"):
+        side = _normalise_side(side)
+        if side is None:
             return {"error": "side must be 'BUY' or 'SELL'"}
         if qty <= 0:
             return {"error": "qty must be a positive integer"}
@@ -117,8 +174,8 @@ def register(env, client, portfolio):
     @env.tool()
     async def cancel_order(order_id: str, symbol: str, side: str) -> dict:
         """Cancel a pending order."""
-        side = side.strip().upper()
-        if side not in ("BUY", "SELL"):
+        side = _normalise_side(side)
+        if side is None:
             return {"error": "side must be 'BUY' or 'SELL'"}
 
         client.cancel_order(order_id, symbol, side)
@@ -127,6 +184,14 @@ def register(env, client, portfolio):
     @env.tool()
     async def poll_fills() -> dict:
         """Fetch new fills and apply all pending order updates."""
-        events = client.poll_order_events()
-        fills = _apply_order_events(events)
+        fills = _apply_order_events(client.poll_order_events())
+        if fills:
+            # A burst is likely still landing; fold it into this reply instead of the next turn
+            deadline = time.monotonic() + _FILL_COALESCE_CAP_S
+            while time.monotonic() < deadline:
+                await asyncio.sleep(_FILL_COALESCE_WINDOW_S)
+                more = _apply_order_events(client.poll_order_events())
+                if not more:
+                    break
+                fills.extend(more)
         return {"fills": fills, "count": len(fills)}